@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Commit Classifier Benchmark
+
+Features:
+1. Accuracy against the labeled fixtures in fixtures/commit_labels.yaml
+2. Latency on synthetic diffs up to 10k files, checked against the time budget
+
+Usage:
+    python benchmarks/bench_commit_classifier.py [--files 10000] [--rounds 5]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from commit_classifier import CommitClassifier, FileChange, parse_diff  # noqa: E402
+
+
+def load_config() -> dict:
+    with open(ROOT / "config/skills-config.yaml", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def load_fixtures() -> list:
+    with open(ROOT / "benchmarks/fixtures/commit_labels.yaml", encoding="utf-8") as f:
+        return yaml.safe_load(f) or []
+
+
+def fixture_changes(files: list) -> list:
+    changes = []
+    for line in files:
+        status, added, deleted, path = line.split(" ", 3)
+        changes.append(FileChange(path, status, int(added), int(deleted)))
+    return changes
+
+
+def synthetic_diff(count: int, seed: int = 0) -> str:
+    """Build `git diff --raw --numstat -z` output touching `count` files"""
+    rng = random.Random(seed)
+    dirs = ["src/api", "src/core", "lib/util", "tests/unit", "docs", "web/ui", "scripts"]
+    exts = [".py", ".ts", ".md", ".yaml", ".scss"]
+    raw, numstat = [], []
+    for i in range(count):
+        path = f"{rng.choice(dirs)}/mod_{i}{rng.choice(exts)}"
+        status = rng.choice("MMMMAD")
+        raw.append(f":100644 100644 0000000 0000000 {status}\0{path}\0")
+        numstat.append(f"{rng.randint(0, 200)}\t{rng.randint(0, 200)}\t{path}\0")
+    return "".join(raw) + "".join(numstat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the commit classifier")
+    parser.add_argument("--files", type=int, default=10000, help="Files in the largest synthetic diff")
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds per size")
+    args = parser.parse_args()
+
+    classifier = CommitClassifier.from_config(load_config())
+
+    # Accuracy
+    fixtures = load_fixtures()
+    correct = 0
+    for case in fixtures:
+        suggestion = classifier.classify(fixture_changes(case["files"]))
+        label = suggestion.type + (f"({suggestion.scope})" if suggestion.scope else "")
+        ok = label == case["expected"]
+        correct += ok
+        if not ok:
+            print(f"  ✗ expected {case['expected']:<20} got {label:<20} {case['files']}")
+    print(f"Accuracy: {correct}/{len(fixtures)} ({correct / len(fixtures):.0%})")
+    print()
+
+    # Latency
+    print(f"Budget: {classifier.budget_ms} ms")
+    sizes = sorted({size for size in (100, 1000, args.files) if size <= args.files})
+    over_budget = False
+    for size in sizes:
+        output = synthetic_diff(size)
+        parse_times, classify_times = [], []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            changes = parse_diff(output)
+            parse_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            suggestion = classifier.classify(changes)
+            classify_times.append(time.perf_counter() - start)
+
+        parse_ms = min(parse_times) * 1000
+        classify_ms = max(classify_times) * 1000
+        over_budget |= classify_ms > classifier.budget_ms
+        print(
+            f"  {size:>6} files: parse {parse_ms:7.2f} ms, classify {classify_ms:7.2f} ms (max)"
+            f"{', truncated' if suggestion.truncated else ''} -> {suggestion.message}"
+        )
+
+    return 1 if over_budget or correct < len(fixtures) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
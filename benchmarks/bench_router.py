@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Router Benchmark
+
+Features:
+1. Routing throughput over the prompts in fixtures/prompts.txt
+2. Comparison with a naive per-pattern / per-keyword scan
+3. Cost of a cold, disk-cached and in-process router load, using a temporary
+   cache directory so the user's cached router is left alone
+
+The corpus is a small hand-written sample (about 40 prompts covering each
+command and common free-text intents), repeated up to --prompts. It measures
+per-prompt routing cost, not behaviour on a real prompt distribution.
+
+Usage:
+    python benchmarks/bench_router.py [--prompts 100000]
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import router as router_module  # noqa: E402
+from router import Router, load_router  # noqa: E402
+
+CONFIG_PATH = ROOT / "config/skills-config.yaml"
+
+
+def load_corpus(size: int) -> list:
+    lines = (ROOT / "benchmarks/fixtures/prompts.txt").read_text(encoding="utf-8").splitlines()
+    prompts = [line for line in lines if line.strip() and not line.startswith("#")]
+    return (prompts * (size // len(prompts) + 1))[:size]
+
+
+class NaiveRouter:
+    """Baseline: try each pattern and keyword separately"""
+
+    def __init__(self, config: dict):
+        self.default_skill = config["routing"]["default_skill"]
+        self.commands = [
+            (re.compile(entry["pattern"]), entry["skill"])
+            for group in config["commands"].values()
+            for entry in group
+        ]
+        self.keywords = [
+            (re.compile(rf"\b{re.escape(word)}\b"), intent)
+            for intent, words in config["routing"]["intent_keywords"].items()
+            for word in words
+        ]
+
+    def route(self, text: str):
+        lowered = text.lower()
+        intents = {}
+        for pattern, intent in self.keywords:
+            if pattern.search(lowered):
+                intents[intent] = intents.get(intent, 0) + 1
+        for pattern, skill in self.commands:
+            if pattern.match(text):
+                return skill, intents
+        return self.default_skill, intents
+
+
+def throughput(route, prompts: list) -> float:
+    start = time.perf_counter()
+    for prompt in prompts:
+        route(prompt)
+    return len(prompts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the command router")
+    parser.add_argument("--prompts", type=int, default=100000, help="Prompts routed per run")
+    args = parser.parse_args()
+
+    with open(CONFIG_PATH, encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    prompts = load_corpus(args.prompts)
+
+    # Agreement with the naive baseline on which skill is picked
+    compiled = Router(config)
+    naive = NaiveRouter(config)
+    unique = sorted(set(prompts))
+    disagree = []
+    for prompt in unique:
+        route = compiled.route(prompt)
+        skill, _ = naive.route(prompt)
+        # The compiled router only scans the text after a command for intents
+        text = prompt if route.matched_by == "default" else " ".join(route.args)
+        _, intents = naive.route(text)
+        if route.skill != skill or set(route.intents) != set(intents):
+            disagree.append(prompt)
+    print(f"Corpus: {len(unique)} unique prompts, {len(prompts)} routed")
+    print(f"Agreement with baseline (skill and intents): {len(unique) - len(disagree)}/{len(unique)}")
+    for prompt in disagree:
+        print(f"  ✗ {prompt}")
+    print()
+
+    compiled_rate = throughput(compiled.route, prompts)
+    naive_rate = throughput(naive.route, prompts)
+    print(f"Compiled router: {compiled_rate:>12,.0f} prompts/s")
+    print(f"Naive baseline:  {naive_rate:>12,.0f} prompts/s ({compiled_rate / naive_rate:.1f}x)")
+    print()
+
+    # Router load: YAML parse and compile, on-disk cache (a new process), in-process cache
+    rounds = 200
+    with tempfile.TemporaryDirectory() as cache_home:
+        os.environ["XDG_CACHE_HOME"] = cache_home
+        store = router_module.cache_path(CONFIG_PATH)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            router_module._ROUTER_CACHE.clear()
+            store.unlink(missing_ok=True)
+            load_router(config_path=CONFIG_PATH)
+        cold_ms = (time.perf_counter() - start) / rounds * 1000
+        start = time.perf_counter()
+        for _ in range(rounds):
+            router_module._ROUTER_CACHE.clear()
+            load_router(config_path=CONFIG_PATH)
+        disk_ms = (time.perf_counter() - start) / rounds * 1000
+        start = time.perf_counter()
+        for _ in range(rounds):
+            load_router(config_path=CONFIG_PATH)
+        warm_ms = (time.perf_counter() - start) / rounds * 1000
+        print(f"Router load: cold {cold_ms:.3f} ms, disk cache {disk_ms:.3f} ms, in-process {warm_ms:.3f} ms")
+
+    return 1 if disagree else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
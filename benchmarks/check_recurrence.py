@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Recurrence Checks
+
+Features:
+1. Expand the rules in fixtures/recurrence_cases.yaml and compare occurrences
+2. Reject malformed or unsupported rules and recurring tasks without an anchor date
+3. Exercise the standup task-index schedule cache: hit, file change, horizon
+
+Usage:
+    python benchmarks/check_recurrence.py
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import standup  # noqa: E402
+from recurrence import RecurrenceError, RecurrenceRule, rule_from_task  # noqa: E402
+
+FAILURES = []
+
+
+def check(name: str, ok: bool, detail: str = "") -> None:
+    print(f"  {'✓' if ok else '✗'} {name}{'' if ok else f' - {detail}'}")
+    if not ok:
+        FAILURES.append(name)
+
+
+def check_cases() -> None:
+    print("Rule expansion:")
+    with open(ROOT / "benchmarks/fixtures/recurrence_cases.yaml", encoding="utf-8") as f:
+        cases = yaml.safe_load(f)
+    for case in cases:
+        rule = RecurrenceRule.parse(case["rule"], case["start"])
+        got = rule.between(case["from"], case["to"])
+        check(case["name"], got == case["expected"], f"got {[d.isoformat() for d in got]}")
+
+
+def check_errors() -> None:
+    print("Rejected rules:")
+    rejected = (
+        "FREQ=HOURLY",
+        "FREQ=DAILY;BYDAY=XX",
+        "FREQ=MONTHLY;BYMONTHDAY=32",
+        "FREQ=YEARLY;BYMONTH=13",
+        "BYDAY",
+        "FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1",
+        "FREQ=YEARLY;BYWEEKNO=20",
+        "FREQ=WEEKLY;WKST=XX",
+    )
+    for text in rejected:
+        try:
+            RecurrenceRule.parse(text, date(2026, 1, 1))
+            check(text, False, "accepted")
+        except RecurrenceError:
+            check(text, True)
+    try:
+        RecurrenceRule.parse("FREQ=WEEKLY;WKST=SU;BYDAY=MO", date(2026, 1, 1))
+        check("WKST is accepted", True)
+    except RecurrenceError as e:
+        check("WKST is accepted", False, str(e))
+    try:
+        rule_from_task({"recurrence": "FREQ=WEEKLY"})
+        check("task without anchor date", False, "accepted")
+    except RecurrenceError:
+        check("task without anchor date", True)
+
+
+def check_index_cache() -> None:
+    print("Task index cache:")
+    calls = []
+    original = standup.rule_from_task
+
+    def counting(task):
+        calls.append(task["id"])
+        return original(task)
+
+    standup.rule_from_task = counting
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            generator = standup.TodayGenerator(workspace_root=root)
+            generator.today = date(2026, 10, 19)
+            task_dir = generator.output_base_dir / "tasks/recurring"
+            task_dir.mkdir(parents=True)
+            task_file = task_dir / "sync.md"
+
+            def write(rule: str, mtime_offset: int) -> None:
+                task_file.write_text(
+                    f"---\nid: REC-1\ntitle: Sync\ntype: task\nstatus: todo\n"
+                    f"recurrence: \"{rule}\"\nstart: 2026-01-01\n---\n",
+                    encoding="utf-8",
+                )
+                stamp = 1_800_000_000 + mtime_offset
+                os.utime(task_file, (stamp, stamp))
+
+            write("FREQ=WEEKLY;BYDAY=MO", 0)
+            tasks = generator.scan_tasks()
+            check("first scan evaluates the rule", calls == ["REC-1"], f"calls {calls}")
+            check("today's occurrence is categorized", [t["id"] for t in tasks["today"]] == ["REC-1"])
+            check("index file written", generator.index_path.exists())
+
+            generator.scan_tasks()
+            check("unchanged task hits the cache", len(calls) == 1, f"calls {calls}")
+
+            write("FREQ=WEEKLY;BYDAY=TU", 1)
+            tasks = generator.scan_tasks()
+            check("edited task is re-evaluated", len(calls) == 2, f"calls {calls}")
+            check("edited rule takes effect", [t["id"] for t in tasks["upcoming"]] == ["REC-1"])
+
+            generator.today += timedelta(days=7)
+            generator.scan_tasks()
+            check("window inside horizon stays cached", len(calls) == 2, f"calls {calls}")
+
+            generator.today += timedelta(days=generator.recurrence_horizon_days + 1)
+            generator.scan_tasks()
+            check("window past horizon is recomputed", len(calls) == 3, f"calls {calls}")
+    finally:
+        standup.rule_from_task = original
+
+
+def main():
+    check_cases()
+    print()
+    check_errors()
+    print()
+    check_index_cache()
+    print()
+    print(f"{'All checks passed' if not FAILURES else f'{len(FAILURES)} failed'}")
+    return 1 if FAILURES else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Command Runner - Deadline-Aware Subprocess Execution
+
+Features:
+1. Enforce a skill's overall `timeout` as a deadline across all commands
+2. Split the remaining budget, reserving time for calls still to come
+3. Run independent queries concurrently on a small thread pool
+4. Never block on prompts: stdin is closed, git terminal prompts are off, and
+   ssh batch mode / blank askpass apply unless the user configured their own
+5. Record per-command latency for reporting
+
+Usage:
+    from command_runner import CommandRunner
+
+    runner = CommandRunner(budget=60, cwd=root)
+    branch = runner.run(["git", "branch", "--show-current"], reserve=2)
+    status, log = runner.run_many([["git", "status", "--porcelain"], ["git", "log", "-1"]])
+    print("\\n".join(runner.report()))
+"""
+
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+# Smallest slice a pending call is guaranteed when reserving budget
+MIN_CALL_SECONDS = 2.0
+
+# Keep git from prompting on the terminal or taking optional index locks
+GIT_ENV = {
+    "GIT_TERMINAL_PROMPT": "0",
+    "GIT_OPTIONAL_LOCKS": "0",
+}
+
+# Used only when neither GIT_SSH_COMMAND, GIT_SSH nor core.sshCommand is set
+BATCH_SSH_COMMAND = "ssh -o BatchMode=yes"
+
+# Used only when neither GIT_ASKPASS, core.askPass nor SSH_ASKPASS is set;
+# a configured helper (IDE terminals, CI scripts) is left to answer
+NO_ASKPASS_ENV = {"GIT_ASKPASS": "", "SSH_ASKPASS": ""}
+
+
+class CommandResult:
+    """Outcome of one command, shaped like subprocess.CompletedProcess"""
+
+    __slots__ = ("args", "returncode", "stdout", "stderr", "elapsed", "timed_out")
+
+    def __init__(self, args: Sequence[str], returncode: int, stdout: str, stderr: str, elapsed: float, timed_out: bool):
+        self.args = list(args)
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.elapsed = elapsed
+        self.timed_out = timed_out
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+
+class CommandRunner:
+    """Run commands under one shared deadline"""
+
+    def __init__(self, budget: float, cwd: Optional[Path] = None, max_workers: int = 4):
+        self.budget = budget
+        self.cwd = cwd
+        self.max_workers = max_workers
+        self.deadline = time.monotonic() + budget
+        self.timings: List[CommandResult] = []
+        self._env = dict(os.environ, **GIT_ENV)
+        self._prompts_checked = False
+        self._prompt_lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline"""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def _allowance(self, timeout: Optional[float], reserve: int) -> float:
+        """Time this call may use, leaving MIN_CALL_SECONDS for each reserved call"""
+        allowance = self.remaining() - reserve * MIN_CALL_SECONDS
+        if allowance < MIN_CALL_SECONDS:
+            # Not enough to honour the reservation: split what is left evenly
+            allowance = self.remaining() / (reserve + 1)
+        if timeout is not None:
+            allowance = min(allowance, timeout)
+        return allowance
+
+    def run(self, args: Sequence[str], timeout: Optional[float] = None, reserve: int = 0, text: bool = True) -> CommandResult:
+        """Run one command within its share of the remaining budget
+
+        `timeout` caps this call; `reserve` is the number of calls still to
+        run after it, each of which keeps at least MIN_CALL_SECONDS.
+        """
+        return self._execute(args, self._allowance(timeout, reserve), text)
+
+    def run_many(
+        self, commands: Sequence[Sequence[str]], timeout: Optional[float] = None, reserve: int = 0, text: bool = True
+    ) -> List[CommandResult]:
+        """Run independent commands concurrently; results keep input order"""
+        allowance = self._allowance(timeout, reserve)
+        if len(commands) <= 1 or self.max_workers <= 1:
+            return [self._execute(args, allowance, text) for args in commands]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(commands))) as pool:
+            futures = [pool.submit(self._execute, args, allowance, text) for args in commands]
+            return [future.result() for future in futures]
+
+    def _check_prompts(self) -> None:
+        """Once, disable ssh and askpass prompts the user has not configured
+
+        A configured GIT_SSH_COMMAND, GIT_SSH or core.sshCommand is left alone,
+        as is GIT_ASKPASS, core.askPass or SSH_ASKPASS; those runs rely on the
+        closed stdin, GIT_TERMINAL_PROMPT=0 and the timeout.
+        """
+        with self._prompt_lock:
+            if self._prompts_checked:
+                return
+            self._prompts_checked = True
+            ssh_set = bool(self._env.get("GIT_SSH_COMMAND") or self._env.get("GIT_SSH"))
+            askpass_set = "GIT_ASKPASS" in self._env or "SSH_ASKPASS" in self._env
+            if ssh_set and askpass_set:
+                return
+            try:
+                proc = subprocess.run(
+                    ["git", "config", "--get-regexp", r"^core\.(sshcommand|askpass)$"],
+                    cwd=self.cwd,
+                    env=self._env,
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    text=True,
+                    timeout=max(0.1, min(MIN_CALL_SECONDS, self.remaining())),
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                return
+            # Exit 1 means neither key is set
+            if proc.returncode not in (0, 1):
+                return
+            configured = {line.split(" ", 1)[0].lower() for line in proc.stdout.splitlines()}
+            if not ssh_set and "core.sshcommand" not in configured:
+                self._env["GIT_SSH_COMMAND"] = BATCH_SSH_COMMAND
+            if not askpass_set and "core.askpass" not in configured:
+                self._env.update(NO_ASKPASS_ENV)
+
+    def _execute(self, args: Sequence[str], allowance: float, text: bool) -> CommandResult:
+        """Run a command with a hard timeout, capturing output once"""
+        start = time.monotonic()
+        if allowance <= 0:
+            result = CommandResult(args, -1, "", "Skill time budget exhausted", 0.0, True)
+            self.timings.append(result)
+            return result
+
+        if args and args[0] == "git" and not self._prompts_checked:
+            self._check_prompts()
+
+        try:
+            proc = subprocess.run(
+                args,
+                cwd=self.cwd,
+                env=self._env,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=text,
+                encoding="utf-8" if text else None,
+                errors="replace" if text else None,
+                timeout=allowance,
+            )
+            result = CommandResult(args, proc.returncode, proc.stdout, proc.stderr, time.monotonic() - start, False)
+        except subprocess.TimeoutExpired:
+            empty = "" if text else b""
+            result = CommandResult(args, -1, empty, f"Timed out after {allowance:.1f}s", time.monotonic() - start, True)
+        except OSError as e:
+            empty = "" if text else b""
+            result = CommandResult(args, -1, empty, str(e), time.monotonic() - start, False)
+
+        self.timings.append(result)
+        return result
+
+    def report(self) -> List[str]:
+        """Per-command latency lines, slowest first"""
+        lines = []
+        for result in sorted(self.timings, key=lambda r: r.elapsed, reverse=True):
+            flag = " (timeout)" if result.timed_out else "" if result.returncode == 0 else f" (exit {result.returncode})"
+            lines.append(f"{result.elapsed * 1000:8.1f} ms  {' '.join(result.args)}{flag}")
+        return lines
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Commit Classifier - Conventional Commit Suggestions from Diff Analysis
+
+Features:
+1. Parse `git diff --raw --numstat -z` output in a single pass
+2. Score files against path conventions and config `auto_tag_rules`
+   using precompiled matchers
+3. Suggest a conventional-commit type, scope and summary
+4. Stop scoring when a time budget is spent, classifying on the files seen
+
+Usage:
+    from commit_classifier import CommitClassifier
+
+    classifier = CommitClassifier.from_config(config)
+    changes = parse_diff(git_output)
+    suggestion = classifier.classify(changes)
+    print(suggestion.message)
+"""
+
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+# Path conventions checked in order; the first match sets the file's category
+PATH_CONVENTIONS: List[Tuple[str, str]] = [
+    ("test", r"(^|/)(tests?|__tests__|spec|specs|testing)/|(^|/)test_[^/]*$|_test\.\w+$|\.(test|spec)\.\w+$|(^|/)conftest\.py$"),
+    ("ci", r"^\.github/workflows/|^\.gitlab-ci\.yml$|^\.circleci/|(^|/)Jenkinsfile$|^\.travis\.yml$|^azure-pipelines\.yml$"),
+    ("build", r"(^|/)(setup\.py|setup\.cfg|pyproject\.toml|requirements[^/]*\.txt|Pipfile(\.lock)?|poetry\.lock|package(-lock)?\.json|yarn\.lock|pnpm-lock\.yaml|Cargo\.(toml|lock)|go\.(mod|sum)|Makefile|Dockerfile|CMakeLists\.txt|tox\.ini|noxfile\.py)$"),
+    ("docs", r"(^|/)(docs?|documentation)/|\.(md|rst|adoc|txt)$|(^|/)(README|CHANGELOG|CONTRIBUTING|LICENSE)[^/]*$"),
+    ("style", r"\.(css|scss|sass|less)$|(^|/)\.(editorconfig|prettierrc[^/]*|eslintrc[^/]*|flake8|pylintrc)$"),
+    ("chore", r"(^|/)\.[^/]+$|\.(ya?ml|toml|ini|cfg|json|lock)$"),
+]
+
+# auto_tag_rules tags -> conventional-commit types
+TAG_TYPES = {
+    "bug": "fix",
+    "feature": "feat",
+    "refactor": "refactor",
+    "docs": "docs",
+    "test": "test",
+    "performance": "perf",
+}
+
+# Categories that name the commit type when they cover the whole change
+CATEGORY_TYPES = {"test": "test", "docs": "docs", "ci": "ci", "build": "build", "style": "style", "chore": "chore"}
+
+# Tie-break order, most specific first
+TYPE_PRIORITY = ["fix", "perf", "refactor", "test", "docs", "ci", "build", "style", "feat", "chore"]
+
+# Directories too generic to be a scope on their own
+GENERIC_DIRS = {
+    "src", "lib", "app", "pkg", "packages", "internal", "source",
+    "test", "tests", "__tests__", "spec", "specs", "testing", "doc", "docs", "documentation",
+}
+
+DEFAULT_BUDGET_MS = 200
+_CHECK_EVERY = 256
+_TOKEN_SPLIT = re.compile(r"[/_\-.\s]+")
+
+
+class FileChange:
+    """One changed file from the diff"""
+
+    __slots__ = ("path", "status", "added", "deleted", "old_path")
+
+    def __init__(self, path: str, status: str = "M", added: int = 0, deleted: int = 0, old_path: str = ""):
+        self.path = path
+        self.status = status
+        self.added = added
+        self.deleted = deleted
+        self.old_path = old_path
+
+    @property
+    def weight(self) -> int:
+        """Lines touched, at least 1 so binary and pure renames still count"""
+        return max(1, self.added + self.deleted)
+
+
+class CommitSuggestion:
+    """Suggested conventional commit"""
+
+    def __init__(self, type_: str, scope: str, summary: str, scores: Dict[str, float], files: int, truncated: bool):
+        self.type = type_
+        self.scope = scope
+        self.summary = summary
+        self.scores = scores
+        self.files = files
+        self.truncated = truncated
+
+    @property
+    def message(self) -> str:
+        scope = f"({self.scope})" if self.scope else ""
+        return f"{self.type}{scope}: {self.summary}"
+
+
+def parse_diff(output: str) -> List[FileChange]:
+    """Parse `git diff --raw --numstat -z` output into file changes"""
+    fields = output.split("\0")
+    changes: List[FileChange] = []
+    by_path: Dict[str, FileChange] = {}
+    i = 0
+    n = len(fields)
+
+    while i < n:
+        field = fields[i]
+        if not field:
+            i += 1
+            continue
+
+        # Raw record: ":mode mode sha sha STATUS" NUL path [NUL new_path]
+        if field.startswith(":"):
+            status = field.rsplit(" ", 1)[-1]
+            kind = status[:1]
+            if kind in ("R", "C") and i + 2 < n:
+                change = FileChange(fields[i + 2], kind, old_path=fields[i + 1])
+                i += 3
+            elif i + 1 < n:
+                change = FileChange(fields[i + 1], kind)
+                i += 2
+            else:
+                break
+            changes.append(change)
+            by_path[change.path] = change
+            continue
+
+        # Numstat record: "added\tdeleted\tpath" or "added\tdeleted\t" NUL old NUL new
+        parts = field.split("\t", 2)
+        if len(parts) == 3:
+            added, deleted, path = parts
+            if not path and i + 2 < n:
+                path = fields[i + 2]
+                i += 3
+            else:
+                i += 1
+            change = by_path.get(path)
+            if change is None:
+                change = FileChange(path)
+                changes.append(change)
+                by_path[path] = change
+            change.added = int(added) if added.isdigit() else 0
+            change.deleted = int(deleted) if deleted.isdigit() else 0
+            continue
+
+        i += 1
+
+    return changes
+
+
+class CommitClassifier:
+    """Score diff files and suggest a conventional commit"""
+
+    def __init__(self, tag_rules: Optional[List[Dict[str, Any]]] = None, budget_ms: int = DEFAULT_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self._categories: List[Tuple[str, Pattern[str]]] = [
+            (name, re.compile(pattern, re.IGNORECASE)) for name, pattern in PATH_CONVENTIONS
+        ]
+        # keyword -> commit type, looked up per path token
+        self._keywords: Dict[str, str] = {}
+        for rule in tag_rules or []:
+            type_ = TAG_TYPES.get(rule.get("tag", ""))
+            if not type_:
+                continue
+            for keyword in rule.get("keywords", []):
+                for token in _TOKEN_SPLIT.split(str(keyword).lower()):
+                    if token:
+                        self._keywords.setdefault(token, type_)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "CommitClassifier":
+        """Build from the loaded skills-config"""
+        tag_rules = config.get("workflow", {}).get("auto_tag_rules", [])
+        budget_ms = config.get("skills", {}).get("wrap", {}).get("commit_suggest_budget_ms", DEFAULT_BUDGET_MS)
+        return cls(tag_rules, budget_ms)
+
+    def _category(self, path: str) -> str:
+        """Path-convention category of a file, or "code" """
+        for name, pattern in self._categories:
+            if pattern.search(path):
+                return name
+        return "code"
+
+    def _keyword_type(self, path: str) -> Optional[str]:
+        """Commit type implied by auto_tag_rules keywords in the path"""
+        for token in _TOKEN_SPLIT.split(path.lower()):
+            type_ = self._keywords.get(token)
+            if type_:
+                return type_
+        return None
+
+    @staticmethod
+    def _scope_of(path: str) -> str:
+        """Scope candidate for a file: first directory that is not generic"""
+        parts = path.split("/")[:-1]
+        for part in parts:
+            if part.startswith("."):
+                return ""
+            if part.lower() not in GENERIC_DIRS:
+                return part
+        return ""
+
+    def classify(self, changes: List[FileChange]) -> Optional[CommitSuggestion]:
+        """Suggest a commit for the changes, or None if there are none"""
+        if not changes:
+            return None
+
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        scores: Counter = Counter()
+        categories: Counter = Counter()
+        scopes: Counter = Counter()
+        statuses: Counter = Counter()
+        seen = 0
+        truncated = False
+
+        for change in changes:
+            if seen % _CHECK_EVERY == 0 and seen and time.perf_counter() > deadline:
+                truncated = True
+                break
+            seen += 1
+
+            weight = change.weight
+            category = self._category(change.path)
+            categories[category] += weight
+            statuses[change.status] += 1
+            scopes[self._scope_of(change.path)] += weight
+
+            if category in CATEGORY_TYPES:
+                scores[CATEGORY_TYPES[category]] += weight
+                continue
+
+            keyword_type = self._keyword_type(change.path)
+            if keyword_type:
+                scores[keyword_type] += weight
+            elif change.status == "A":
+                scores["feat"] += weight
+            elif change.status in ("D", "R"):
+                scores["refactor"] += weight
+            elif change.deleted > change.added * 2:
+                scores["refactor"] += weight
+            else:
+                scores["feat"] += weight
+
+        type_ = self._pick_type(scores, categories)
+        scope = self._pick_scope(scopes)
+        summary = self._summary(type_, changes[:seen], statuses)
+        return CommitSuggestion(type_, scope, summary, dict(scores), len(changes), truncated)
+
+    @staticmethod
+    def _pick_type(scores: Counter, categories: Counter) -> str:
+        """Highest-scoring type; code changes outrank supporting files"""
+        if not scores:
+            return "chore"
+        code = categories.get("code", 0)
+        # Tests/docs alongside code describe the code change, not the commit
+        if code:
+            code_scores = {t: s for t, s in scores.items() if t not in ("test", "docs")}
+            if code_scores:
+                scores = Counter(code_scores)
+        best = max(scores.values())
+        for type_ in TYPE_PRIORITY:
+            if scores.get(type_) == best:
+                return type_
+        return "chore"
+
+    @staticmethod
+    def _pick_scope(scopes: Counter) -> str:
+        """Scope shared by most of the change, if any"""
+        total = sum(scopes.values())
+        if not total:
+            return ""
+        scope, weight = scopes.most_common(1)[0]
+        return scope if scope and weight * 2 > total else ""
+
+    @staticmethod
+    def _summary(type_: str, changes: List[FileChange], statuses: Counter) -> str:
+        """Short imperative summary of the change"""
+        if len(changes) == 1:
+            change = changes[0]
+            name = change.path.rsplit("/", 1)[-1]
+            verb = {"A": "add", "D": "remove", "R": "rename"}.get(change.status, "update")
+            return f"{verb} {name}"
+        if statuses.get("A", 0) == len(changes):
+            return f"add {len(changes)} files"
+        if statuses.get("D", 0) == len(changes):
+            return f"remove {len(changes)} files"
+        noun = {"test": "tests", "docs": "documentation", "ci": "CI configuration", "build": "build configuration"}.get(
+            type_, f"{len(changes)} files"
+        )
+        return f"update {noun}"
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Output Writer - Atomic, Batched File Outputs
+
+Features:
+1. Write to a temp file in the target directory and rename it into place
+2. Skip writes whose content hash matches the file on disk, keeping mtimes
+   (volatile lines such as a generation timestamp can be left out of the hash)
+3. Batch fsyncs: files are synced together on commit, each directory once
+
+Usage:
+    from output_writer import OutputWriter
+
+    with OutputWriter() as writer:
+        writer.write_text(path_a, content_a)
+        writer.write_text(path_b, content_b)
+    # Both files are in place here; on error neither is replaced
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+def _default_mode() -> int:
+    """Permissions a plain open(..., "w") would create under the current umask"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _digest(data: bytes, ignore_prefix: Optional[bytes] = None) -> bytes:
+    """SHA-256 of `data`, skipping lines that start with `ignore_prefix`"""
+    if ignore_prefix is None:
+        return hashlib.sha256(data).digest()
+    h = hashlib.sha256()
+    for line in data.splitlines(keepends=True):
+        if not line.startswith(ignore_prefix):
+            h.update(line)
+    return h.digest()
+
+
+def _file_digest(path: Path, size: int, ignore_prefix: Optional[bytes] = None) -> Optional[bytes]:
+    """Digest of an existing file, or None if missing (or, for exact compares, a different size)"""
+    try:
+        if ignore_prefix is None and os.stat(path).st_size != size:
+            return None
+        with open(path, "rb") as f:
+            return _digest(f.read(), ignore_prefix)
+    except OSError:
+        return None
+
+
+class OutputWriter:
+    """Stage outputs as temp files and atomically rename them on commit"""
+
+    def __init__(self, fsync: bool = True):
+        self.fsync = fsync
+        self._mode = _default_mode()
+        # (fd, temp path, target path) for each staged write
+        self._pending: List[Tuple[int, str, Path]] = []
+        self.written: List[Path] = []
+        self.unchanged: List[Path] = []
+
+    def __enter__(self) -> "OutputWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+    def write_text(
+        self, path: Path, content: str, encoding: str = "utf-8", ignore_prefix: Optional[str] = None
+    ) -> bool:
+        """Stage `content` for `path`; returns False if the file is unchanged
+
+        Lines starting with `ignore_prefix` (e.g. a generation timestamp) are
+        left out of the comparison, so they alone never trigger a rewrite.
+        """
+        prefix = ignore_prefix.encode(encoding) if ignore_prefix is not None else None
+        return self.write_bytes(path, content.encode(encoding), ignore_prefix=prefix)
+
+    def write_bytes(self, path: Path, data: bytes, ignore_prefix: Optional[bytes] = None) -> bool:
+        """Stage `data` for `path`; returns False if the file is unchanged"""
+        path = Path(path)
+
+        # A later write to the same target supersedes the staged one
+        for i, (fd, tmp, target) in enumerate(self._pending):
+            if target == path:
+                self._close_and_remove(fd, tmp)
+                del self._pending[i]
+                break
+
+        if _file_digest(path, len(data), ignore_prefix) == _digest(data, ignore_prefix):
+            self.unchanged.append(path)
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            try:
+                mode = os.stat(path).st_mode & 0o7777
+            except OSError:
+                mode = self._mode
+            os.chmod(tmp, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        except BaseException:
+            self._close_and_remove(fd, tmp)
+            raise
+        self._pending.append((fd, tmp, path))
+        return True
+
+    def commit(self) -> List[Path]:
+        """Sync staged files, rename them into place and sync their directories"""
+        pending, self._pending = self._pending, []
+        try:
+            for fd, _, _ in pending:
+                if self.fsync:
+                    os.fsync(fd)
+        except BaseException:
+            for fd, tmp, _ in pending:
+                self._close_and_remove(fd, tmp)
+            raise
+
+        dirs = set()
+        committed = []
+        for fd, tmp, target in pending:
+            os.close(fd)
+            os.replace(tmp, target)
+            dirs.add(target.parent)
+            committed.append(target)
+
+        if self.fsync:
+            for directory in dirs:
+                self._fsync_dir(directory)
+
+        self.written.extend(committed)
+        return committed
+
+    def discard(self) -> None:
+        """Drop all staged writes, leaving targets untouched"""
+        pending, self._pending = self._pending, []
+        for fd, tmp, _ in pending:
+            self._close_and_remove(fd, tmp)
+
+    @staticmethod
+    def _close_and_remove(fd: int, tmp: str) -> None:
+        """Close and delete a temp file, ignoring errors"""
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Persist a rename by syncing its directory (no-op where unsupported)"""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def write_text_atomic(path: Path, content: str, fsync: bool = True) -> bool:
+    """Atomically write a single file; returns False if it was unchanged"""
+    with OutputWriter(fsync=fsync) as writer:
+        return writer.write_text(path, content)
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Recurrence - RRULE-like Rules for Recurring Tasks
+
+Features:
+1. Parse RRULE-style rules from task frontmatter
+2. Expand occurrences lazily, skipping ahead to the requested window
+3. Support DAILY / WEEKLY / MONTHLY / YEARLY with INTERVAL, BYDAY,
+   BYMONTHDAY, BYMONTH, COUNT and UNTIL; reject parts that would change
+   the schedule but are not implemented (BYSETPOS, BYWEEKNO, ...)
+
+Rule format (frontmatter `recurrence` or `rrule`):
+    recurrence: "FREQ=WEEKLY;BYDAY=MO,WE"
+    recurrence: "FREQ=MONTHLY;BYDAY=-1FR"       # last Friday
+    recurrence: "FREQ=MONTHLY;BYMONTHDAY=1,15;COUNT=12"
+    start: 2026-01-05                           # DTSTART (falls back to created/due; required)
+
+Usage:
+    from recurrence import RecurrenceRule
+
+    rule = RecurrenceRule.parse("FREQ=DAILY;INTERVAL=2", start=date(2026, 1, 1))
+    for day in rule.between(today, today + timedelta(days=7)):
+        ...
+"""
+
+import calendar
+import re
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+
+# Rule parts understood here; WKST is accepted but has no effect. Anything
+# else (BYSETPOS, BYWEEKNO, ...) would change the schedule, so it is rejected
+SUPPORTED_PARTS = frozenset(
+    ("FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "BYMONTHDAY", "BYMONTH", "WKST")
+)
+
+# Span of empty periods walked when looking for the next occurrence, so rules
+# that can never match (e.g. BYMONTH=2;BYMONTHDAY=31) terminate while sparse
+# ones (e.g. a leap day, up to 8 years apart) still find their next date
+MAX_EMPTY_YEARS = 8
+PERIODS_PER_YEAR = {"DAILY": 366, "WEEKLY": 53, "MONTHLY": 12, "YEARLY": 1}
+
+_BYDAY_RE = re.compile(r"^([+-]?\d{1,2})?(MO|TU|WE|TH|FR|SA|SU)$")
+
+
+class RecurrenceError(ValueError):
+    """Raised when a recurrence rule cannot be parsed"""
+
+
+def _to_date(value) -> Optional[date]:
+    """Coerce frontmatter date values to date"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value)[:10].replace("/", "-"), "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+class RecurrenceRule:
+    """A parsed RRULE-like recurrence rule anchored at a start date"""
+
+    def __init__(
+        self,
+        freq: str,
+        start: date,
+        interval: int = 1,
+        byday: Optional[List[Tuple[int, int]]] = None,
+        bymonthday: Optional[List[int]] = None,
+        bymonth: Optional[List[int]] = None,
+        count: Optional[int] = None,
+        until: Optional[date] = None,
+    ):
+        self.freq = freq
+        self.start = start
+        self.interval = max(1, interval)
+        self.byday = byday or []
+        self.bymonthday = bymonthday or []
+        self.bymonth = bymonth or []
+        self.count = count
+        self.until = until
+
+    @classmethod
+    def parse(cls, text: str, start: date) -> "RecurrenceRule":
+        """Parse `FREQ=...;KEY=VALUE` rule text"""
+        if not text:
+            raise RecurrenceError("Empty recurrence rule")
+
+        body = str(text).strip()
+        if body.upper().startswith("RRULE:"):
+            body = body[6:]
+
+        fields: Dict[str, str] = {}
+        for part in body.split(";"):
+            if not part.strip():
+                continue
+            if "=" not in part:
+                raise RecurrenceError(f"Invalid rule part: {part}")
+            key, value = part.split("=", 1)
+            key = key.strip().upper()
+            if key not in SUPPORTED_PARTS:
+                raise RecurrenceError(f"Unsupported rule part: {key}")
+            fields[key] = value.strip().upper()
+
+        freq = fields.get("FREQ")
+        if freq not in FREQUENCIES:
+            raise RecurrenceError(f"Unsupported FREQ: {freq}")
+
+        try:
+            interval = int(fields.get("INTERVAL", 1))
+            count = int(fields["COUNT"]) if "COUNT" in fields else None
+            bymonthday = [int(v) for v in fields["BYMONTHDAY"].split(",")] if "BYMONTHDAY" in fields else []
+            bymonth = [int(v) for v in fields["BYMONTH"].split(",")] if "BYMONTH" in fields else []
+        except ValueError as e:
+            raise RecurrenceError(f"Invalid numeric value: {e}") from None
+
+        if any(not 1 <= abs(n) <= 31 for n in bymonthday):
+            raise RecurrenceError("BYMONTHDAY must be 1..31 or -31..-1")
+        if any(not 1 <= m <= 12 for m in bymonth):
+            raise RecurrenceError("BYMONTH must be 1..12")
+
+        if "WKST" in fields and fields["WKST"] not in WEEKDAYS:
+            raise RecurrenceError(f"Invalid WKST: {fields['WKST']}")
+
+        byday = []
+        if "BYDAY" in fields:
+            for token in fields["BYDAY"].split(","):
+                match = _BYDAY_RE.match(token.strip())
+                if not match:
+                    raise RecurrenceError(f"Invalid BYDAY: {token}")
+                byday.append((int(match.group(1) or 0), WEEKDAYS[match.group(2)]))
+
+        until = None
+        if "UNTIL" in fields:
+            raw = fields["UNTIL"]
+            until = _to_date(f"{raw[:4]}-{raw[4:6]}-{raw[6:8]}" if raw[:8].isdigit() else raw)
+            if until is None:
+                raise RecurrenceError(f"Invalid UNTIL: {raw}")
+
+        return cls(freq, start, interval, byday, bymonthday, bymonth, count, until)
+
+    # ---------- Period expansion ----------
+
+    def _first_period(self, after: date) -> int:
+        """Index of the first period that may contain dates >= after"""
+        if after <= self.start:
+            return 0
+        if self.freq == "DAILY":
+            span = (after - self.start).days
+        elif self.freq == "WEEKLY":
+            week0 = self.start - timedelta(days=self.start.weekday())
+            span = (after - week0).days // 7
+        elif self.freq == "MONTHLY":
+            span = (after.year - self.start.year) * 12 + after.month - self.start.month
+        else:
+            span = after.year - self.start.year
+        return max(0, span // self.interval)
+
+    def _period_start(self, index: int) -> date:
+        """First day of the period with the given index"""
+        step = index * self.interval
+        if self.freq == "DAILY":
+            return self.start + timedelta(days=step)
+        if self.freq == "WEEKLY":
+            return self.start - timedelta(days=self.start.weekday()) + timedelta(weeks=step)
+        if self.freq == "MONTHLY":
+            months = self.start.year * 12 + self.start.month - 1 + step
+            return date(months // 12, months % 12 + 1, 1)
+        return date(self.start.year + step, 1, 1)
+
+    def _monthday_ok(self, day: date) -> bool:
+        """Whether `day` satisfies BYMONTHDAY (always true when unset)"""
+        if not self.bymonthday:
+            return True
+        last = calendar.monthrange(day.year, day.month)[1]
+        return any(day.day == (n if n > 0 else last + n + 1) for n in self.bymonthday)
+
+    @staticmethod
+    def _nth_weekdays(days: List[date], nth: int) -> List[date]:
+        """All of `days` for nth == 0, else the nth (or -nth from the end)"""
+        if nth == 0:
+            return days
+        if -len(days) <= nth <= len(days):
+            return [days[nth - 1 if nth > 0 else nth]]
+        return []
+
+    def _month_days(self, year: int, month: int) -> List[date]:
+        """Candidate days within one month; BYDAY is limited by BYMONTHDAY"""
+        last = calendar.monthrange(year, month)[1]
+
+        if self.byday:
+            days = set()
+            for nth, weekday in self.byday:
+                first = (weekday - date(year, month, 1).weekday()) % 7 + 1
+                weekdays = [date(year, month, d) for d in range(first, last + 1, 7)]
+                days.update(self._nth_weekdays(weekdays, nth))
+            return sorted(d for d in days if self._monthday_ok(d))
+
+        if self.bymonthday:
+            return [date(year, month, d) for d in range(1, last + 1) if self._monthday_ok(date(year, month, d))]
+
+        return [date(year, month, self.start.day)] if self.start.day <= last else []
+
+    def _year_days(self, year: int) -> List[date]:
+        """BYDAY expanded over a whole year (nth counts within the year)"""
+        jan1 = date(year, 1, 1)
+        days = set()
+        for nth, weekday in self.byday:
+            first = jan1 + timedelta(days=(weekday - jan1.weekday()) % 7)
+            weekdays = []
+            while first.year == year:
+                weekdays.append(first)
+                first += timedelta(weeks=1)
+            days.update(self._nth_weekdays(weekdays, nth))
+        return sorted(d for d in days if self._monthday_ok(d))
+
+    def _candidates(self, period: date) -> List[date]:
+        """Candidate occurrences within one period, in order"""
+        if self.freq == "DAILY":
+            if self.bymonth and period.month not in self.bymonth:
+                return []
+            if self.byday and period.weekday() not in {wd for _, wd in self.byday}:
+                return []
+            return [period] if self._monthday_ok(period) else []
+
+        if self.freq == "WEEKLY":
+            weekdays = sorted({wd for _, wd in self.byday}) or [self.start.weekday()]
+            days = [period + timedelta(days=wd) for wd in weekdays]
+            if self.bymonth:
+                days = [d for d in days if d.month in self.bymonth]
+            return [d for d in days if self._monthday_ok(d)]
+
+        if self.freq == "MONTHLY":
+            if self.bymonth and period.month not in self.bymonth:
+                return []
+            return self._month_days(period.year, period.month)
+
+        # YEARLY: BYMONTH picks months; otherwise BYDAY spans the year,
+        # BYMONTHDAY applies to every month, and a bare rule repeats the start date
+        year = period.year
+        if self.bymonth:
+            days = []
+            for month in sorted(self.bymonth):
+                days.extend(self._month_days(year, month))
+            return days
+        if self.byday:
+            return self._year_days(year)
+        if self.bymonthday:
+            return [d for month in range(1, 13) for d in self._month_days(year, month)]
+        last = calendar.monthrange(year, self.start.month)[1]
+        return [date(year, self.start.month, self.start.day)] if self.start.day <= last else []
+
+    def iter_occurrences(self, after: Optional[date] = None) -> Iterator[date]:
+        """Lazily yield occurrences on or after `after`, in order"""
+        after = after or self.start
+        # COUNT is relative to the start, so those rules cannot skip ahead
+        index = 0 if self.count is not None else self._first_period(after)
+        emitted = 0
+        empty = 0
+        max_empty = -(-PERIODS_PER_YEAR[self.freq] * MAX_EMPTY_YEARS // self.interval)
+
+        while empty < max_empty:
+            period = self._period_start(index)
+            if self.until and period > self.until:
+                return
+            found = False
+            for day in self._candidates(period):
+                if day < self.start:
+                    continue
+                if self.until and day > self.until:
+                    return
+                emitted += 1
+                found = True
+                if day >= after:
+                    yield day
+                if self.count is not None and emitted >= self.count:
+                    return
+            empty = 0 if found else empty + 1
+            index += 1
+
+    def between(self, start: date, end: date) -> List[date]:
+        """Occurrences within [start, end]"""
+        days = []
+        for day in self.iter_occurrences(after=start):
+            if day > end:
+                break
+            days.append(day)
+        return days
+
+    def next_after(self, after: date) -> Optional[date]:
+        """First occurrence on or after `after`, or None if the rule is exhausted"""
+        return next(self.iter_occurrences(after=after), None)
+
+
+def rule_from_task(task: Dict) -> Optional[RecurrenceRule]:
+    """Build a rule from task frontmatter, or None for one-off tasks"""
+    text = task.get("recurrence") or task.get("rrule")
+    if not text:
+        return None
+    # The anchor fixes the rule's phase (INTERVAL, weekday), so it must be stable
+    start = _to_date(task.get("start")) or _to_date(task.get("created")) or _to_date(task.get("due"))
+    if start is None:
+        raise RecurrenceError("Recurring task needs a start, created or due date")
+    return RecurrenceRule.parse(text, start)
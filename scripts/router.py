@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Router - Compiled Command Dispatcher
+
+Features:
+1. Compile all `commands` patterns into one alternation regex
+2. Compile `routing.intent_keywords` into an Aho-Corasick automaton
+3. Cache the routing tables on disk as JSON keyed by config path and mtime,
+   so each one-shot run skips parsing the YAML config
+4. Dispatch requests to skill handlers in-process, rejecting options the
+   scripts do not implement
+
+Usage:
+    python router.py "@standup --skip-sync" [--workspace /path/to/project] [--dry-run]
+"""
+
+import argparse
+import hashlib
+import os
+import json
+import re
+import shlex
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from output_writer import OutputWriter
+from skill_config import find_config
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton matching whole-word keywords in one pass"""
+
+    def __init__(self, keywords: Dict[str, List[str]]):
+        # keyword -> labels; states are dict transitions plus fail links
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Tuple[str, ...]]]] = [[]]
+
+        for keyword, labels in keywords.items():
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((len(keyword), tuple(labels)))
+
+        # Breadth-first fail links; depth-1 states fail to the root
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                if state:
+                    self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def search(self, text: str) -> List[Tuple[int, int, Tuple[str, ...]]]:
+        """Whole-word matches as (start, end, labels); `text` must be lowercased"""
+        matches = []
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        length = len(text)
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            end = i + 1
+            if end < length and text[end].isalnum():
+                continue
+            for size, labels in out[state]:
+                start = end - size
+                if start == 0 or not text[start - 1].isalnum():
+                    matches.append((start, end, labels))
+        return matches
+
+
+class Route:
+    """Result of routing one request"""
+
+    def __init__(self, skill: str, args: List[str], matched_by: str, intents: Dict[str, int]):
+        self.skill = skill
+        self.args = args
+        self.matched_by = matched_by
+        self.intents = intents
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"skill": self.skill, "args": self.args, "matched_by": self.matched_by, "intents": self.intents}
+
+
+class Router:
+    """Compiled command patterns and intent keywords"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self._compile(self.spec_from_config(config))
+
+    @staticmethod
+    def spec_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
+        """Plain routing tables (JSON-serializable) extracted from the config"""
+        routing = config.get("routing", {})
+        commands = []
+        for group in (config.get("commands") or {}).values():
+            for entry in group or []:
+                commands.append([str(entry["skill"]), str(entry["pattern"])])
+
+        keywords: Dict[str, List[str]] = {}
+        for intent, words in (routing.get("intent_keywords") or {}).items():
+            for word in words or []:
+                keywords.setdefault(str(word).lower(), []).append(str(intent))
+
+        return {
+            "default_skill": str(routing.get("default_skill", "spec")),
+            "commands": commands,
+            "keywords": keywords,
+        }
+
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> "Router":
+        """Router compiled from tables returned by spec_from_config()"""
+        router = cls.__new__(cls)
+        router._compile(spec)
+        return router
+
+    def _compile(self, spec: Dict[str, Any]) -> None:
+        """Build the alternation regex and keyword automaton from routing tables"""
+        self.spec = spec
+        self.default_skill = spec["default_skill"]
+
+        self._skills: Dict[str, str] = {}
+        alternatives = []
+        for skill, pattern in spec["commands"]:
+            name = f"c{len(self._skills)}"
+            self._skills[name] = skill
+            alternatives.append(f"(?P<{name}>{pattern})")
+        self._commands = re.compile("|".join(alternatives)) if alternatives else None
+
+        self._keywords = KeywordAutomaton(spec["keywords"])
+
+    def intents(self, text: str) -> Dict[str, int]:
+        """Intent keyword hit counts"""
+        counts: Dict[str, int] = {}
+        for _, _, labels in self._keywords.search(text.lower()):
+            for label in labels:
+                counts[label] = counts.get(label, 0) + 1
+        return counts
+
+    def route(self, text: str) -> Route:
+        """Route a request to a skill by command prefix, else the default skill"""
+        text = text.strip()
+        if self._commands is not None:
+            match = self._commands.match(text)
+            if match:
+                rest = text[match.end():]
+                try:
+                    args = shlex.split(rest)
+                except ValueError:
+                    args = rest.split()
+                return Route(self._skills[match.lastgroup], args, "command", self.intents(rest))
+        return Route(self.default_skill, [text] if text else [], "default", self.intents(text))
+
+
+# Bump when the routing tables' layout changes so stale caches are rebuilt
+CACHE_VERSION = 2
+
+# Compiled routers keyed by config path, invalidated by mtime
+_ROUTER_CACHE: Dict[str, Tuple[Tuple[int, int], Router]] = {}
+
+
+def cache_path(config_path: Path) -> Path:
+    """On-disk cache file for a config, in the user cache directory"""
+    base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    digest = hashlib.sha1(str(config_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return base / "code-skills" / f"router-{digest}.json"
+
+
+def _load_cached(path: Path, stamp: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """Routing tables cached for this config version, or None if missing or stale"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["version"] != CACHE_VERSION or tuple(cached["stamp"]) != stamp:
+            return None
+        return cached["spec"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_cached(path: Path, stamp: Tuple[int, int], spec: Dict[str, Any]) -> None:
+    """Persist routing tables; the cache is best-effort"""
+    try:
+        with OutputWriter(fsync=False) as writer:
+            writer.write_text(path, json.dumps({"version": CACHE_VERSION, "stamp": list(stamp), "spec": spec}))
+    except OSError:
+        pass
+
+
+def load_router(root: Optional[Path] = None, config_path: Optional[Path] = None) -> Router:
+    """Compiled router for the active config, rebuilt only when it changes"""
+    path = config_path or find_config(root or Path.cwd())
+    if path is None:
+        return Router({})
+
+    key = str(path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _ROUTER_CACHE.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    store = cache_path(path)
+    spec = _load_cached(store, stamp)
+    router = None
+    if spec is not None:
+        try:
+            router = Router.from_spec(spec)
+        except (KeyError, TypeError, ValueError, re.error):
+            router = None
+    if router is None:
+        with open(path, encoding="utf-8") as f:
+            router = Router(yaml.safe_load(f) or {})
+        _store_cached(store, stamp, router.spec)
+    _ROUTER_CACHE[key] = (stamp, router)
+    return router
+
+
+# ---------- Skill handlers ----------
+
+
+# Skill modules are imported on dispatch so routing alone stays cheap
+
+
+class RouteError(ValueError):
+    """Request cannot be run in-process as given"""
+
+
+def _script_flags(route: Route, supported: Tuple[str, ...]) -> Dict[str, bool]:
+    """Boolean options the skill script implements; anything else is rejected
+
+    Options such as `@wrap --push` are steps the assistant runs from SKILL.md,
+    so they must not be dropped silently by the script.
+    """
+    unsupported = [arg for arg in route.args if arg not in supported]
+    if unsupported:
+        raise RouteError(
+            f"@{route.skill} script does not support: {' '.join(unsupported)} "
+            f"(supported: {' '.join(supported)}; see skills/{route.skill}/SKILL.md)"
+        )
+    return {flag.lstrip("-").replace("-", "_"): flag in route.args for flag in supported}
+
+
+def _run_standup(route: Route, root: Path) -> None:
+    """Run @standup in-process"""
+    flags = _script_flags(route, ("--skip-sync", "--timings"))
+    from standup import TodayGenerator
+
+    TodayGenerator(workspace_root=root).run(skip_sync=flags["skip_sync"], show_timings=flags["timings"])
+
+
+def _run_wrap(route: Route, root: Path) -> None:
+    """Run @wrap in-process"""
+    flags = _script_flags(route, ("--timings",))
+    from wrap import EODGenerator
+
+    EODGenerator(workspace_root=root).run(show_timings=flags["timings"])
+
+
+def _show_skill(route: Route, root: Path) -> None:
+    """Skills without a script are executed by the assistant from SKILL.md"""
+    skill_md = Path(__file__).parent.parent / "skills" / route.skill / "SKILL.md"
+    print(f"✅【CodeSkills】- @{route.skill}")
+    print(f"  - Instructions: {skill_md}")
+    if route.args:
+        print(f"  - Args: {' '.join(route.args)}")
+    if route.intents:
+        print(f"  - Intents: {', '.join(sorted(route.intents))}")
+
+
+HANDLERS: Dict[str, Callable[[Route, Path], None]] = {
+    "standup": _run_standup,
+    "wrap": _run_wrap,
+}
+
+
+def dispatch(text: str, root: Optional[Path] = None) -> Route:
+    """Route a request and run its skill handler in-process"""
+    root = root or Path.cwd()
+    route = load_router(root).route(text)
+    HANDLERS.get(route.skill, _show_skill)(route, root)
+    return route
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Route a request to its skill")
+    parser.add_argument("request", help='Request text, e.g. "@standup --skip-sync"')
+    parser.add_argument(
+        "--workspace",
+        type=Path,
+        default=None,
+        help="Workspace root path",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the route without running the skill",
+    )
+    args = parser.parse_args()
+
+    root = args.workspace or Path.cwd()
+    if args.dry_run:
+        print(yaml.safe_dump(load_router(root).route(args.request).to_dict(), sort_keys=False).strip())
+        return
+    try:
+        dispatch(args.request, root)
+    except RouteError as e:
+        print(f"⚠️ {e}")
+        raise SystemExit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Scan Planner - Task File Discovery
+
+Features:
+1. Resolve scan directories from the skill config
+2. Filter files with include/exclude globs
+3. Prune excluded, hidden and attachment subtrees during the walk
+4. Limit walk depth
+
+Usage:
+    from scan_planner import ScanPlanner
+
+    planner = ScanPlanner.from_config(base_dir, skill_config)
+    for md_file in planner.iter_files():
+        ...
+"""
+
+import fnmatch
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Sequence
+
+DEFAULT_INCLUDE = ["*.md"]
+DEFAULT_EXCLUDE = ["README.md"]
+DEFAULT_SKIP_DIRS = [
+    "attachments",
+    "assets",
+    "images",
+    "media",
+    "files",
+    "node_modules",
+    "__pycache__",
+]
+DEFAULT_MAX_DEPTH = 8
+
+
+def _compile_globs(patterns: Sequence[str]) -> Optional[Pattern[str]]:
+    """Compile glob patterns into a single regex, or None if empty"""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+class ScanPlanner:
+    """Plan and execute a pruned walk over task directories"""
+
+    def __init__(
+        self,
+        base_dir: Path,
+        scan_dirs: Sequence[str],
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        skip_dirs: Optional[Sequence[str]] = None,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        skip_hidden: bool = True,
+    ):
+        self.base_dir = base_dir
+        self.scan_dirs = list(scan_dirs)
+        self.max_depth = max_depth
+        self.skip_hidden = skip_hidden
+        self._include = _compile_globs(DEFAULT_INCLUDE if include is None else include)
+        self._exclude = _compile_globs(DEFAULT_EXCLUDE if exclude is None else exclude)
+        self._skip_dirs = frozenset(DEFAULT_SKIP_DIRS if skip_dirs is None else skip_dirs)
+
+    @classmethod
+    def from_config(cls, base_dir: Path, skill_config: Dict[str, Any]) -> "ScanPlanner":
+        """Build a planner from a skill section (e.g. skills.standup)"""
+        return cls(
+            base_dir,
+            skill_config.get("scan_dirs", []) or [],
+            include=skill_config.get("scan_include"),
+            exclude=skill_config.get("scan_exclude"),
+            skip_dirs=skill_config.get("scan_skip_dirs"),
+            max_depth=skill_config.get("scan_max_depth", DEFAULT_MAX_DEPTH),
+            skip_hidden=skill_config.get("scan_skip_hidden", True),
+        )
+
+    def _is_excluded(self, name: str, rel_path: str) -> bool:
+        """Check a name or scan-dir relative path against exclude globs"""
+        if self._exclude is None:
+            return False
+        return bool(self._exclude.match(name) or self._exclude.match(rel_path))
+
+    def _is_included(self, name: str, rel_path: str) -> bool:
+        """Check a name or scan-dir relative path against include globs"""
+        if self._include is None:
+            return True
+        return bool(self._include.match(name) or self._include.match(rel_path))
+
+    def _prune_dir(self, name: str, rel_path: str) -> bool:
+        """Decide whether a subdirectory is skipped without descending"""
+        if self.skip_hidden and name.startswith("."):
+            return True
+        if name in self._skip_dirs:
+            return True
+        return self._is_excluded(name, rel_path)
+
+    def iter_files(self) -> Iterator[Path]:
+        """Yield matching files across all scan directories"""
+        seen = set()
+        for relative_dir in self.scan_dirs:
+            root = self.base_dir / relative_dir
+            if root in seen or not root.is_dir():
+                continue
+            seen.add(root)
+            yield from self._walk(root)
+
+    def _walk(self, root: Path) -> Iterator[Path]:
+        """Depth-limited scandir walk, pruning subtrees before listing them"""
+        stack: List[tuple] = [(str(root), "", 0)]
+        while stack:
+            dir_path, rel_dir, depth = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                rel_path = f"{rel_dir}{entry.name}"
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if depth < self.max_depth and not self._prune_dir(entry.name, rel_path):
+                        subdirs.append((entry.path, f"{rel_path}/", depth + 1))
+                    continue
+
+                if self.skip_hidden and entry.name.startswith("."):
+                    continue
+                if not self._is_included(entry.name, rel_path):
+                    continue
+                if self._is_excluded(entry.name, rel_path):
+                    continue
+                yield Path(entry.path)
+
+            # Reverse so subdirectories are visited in name order
+            stack.extend(reversed(subdirs))
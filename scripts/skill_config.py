@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Skill Config - Locate and Load skills-config.yaml
+
+Features:
+1. One lookup order for every script: project, global installs, then the repo
+2. Load the first config that parses, warning about broken ones
+
+Usage:
+    from skill_config import find_config, load_config
+
+    config = load_config(root)
+    path = find_config(root)
+"""
+
+from pathlib import Path
+from typing import List, Optional
+
+import yaml
+
+
+def config_paths(root: Path) -> List[Path]:
+    """Config locations in lookup order"""
+    return [
+        # Project-level
+        root / ".skills/code-skills/config/skills-config.yaml",
+        root / "code-skills/config/skills-config.yaml",
+        # Claude Code global
+        Path.home() / ".claude/CodeSkills/config/skills-config.yaml",
+        # Codex CLI global
+        Path.home() / ".codex/CodeSkills/config/skills-config.yaml",
+        # Relative to script
+        Path(__file__).parent.parent / "config/skills-config.yaml",
+    ]
+
+
+def find_config(root: Path) -> Optional[Path]:
+    """First existing config path, or None"""
+    for path in config_paths(root):
+        if path.exists():
+            return path
+    return None
+
+
+def load_config(root: Path) -> dict:
+    """Load workflow configuration from multiple possible locations"""
+    for config_path in config_paths(root):
+        if config_path.exists():
+            try:
+                with open(config_path, encoding="utf-8") as f:
+                    return yaml.safe_load(f) or {}
+            except Exception as e:
+                print(f"⚠️ Config load failed: {e}")
+    return {}
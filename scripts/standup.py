@@ -13,13 +13,24 @@ Usage:
 """
 
 import argparse
-import subprocess
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+from command_runner import CommandRunner
+from output_writer import OutputWriter
+from recurrence import RecurrenceError, rule_from_task
+from scan_planner import ScanPlanner
+from skill_config import load_config
+from task_index import TaskIndex
+
+# Footer line left out of the unchanged-content check, so a new timestamp alone
+# does not rewrite today.md
+GENERATED_PREFIX = "*Generated: "
+
 
 class TodayGenerator:
     """Generate daily task summary"""
@@ -31,30 +42,18 @@ class TodayGenerator:
         self.output_base_dir = self.root / self.config.get("workflow", {}).get("output_dir", ".worklogs")
         self.tasks_dir_name = self.config.get("workflow", {}).get("tasks_dir", "tasks")
         self.worklogs_dir_name = self.config.get("workflow", {}).get("worklogs_dir", "worklogs")
+        self.index_path = self.output_base_dir / self.config.get("workflow", {}).get(
+            "index_file", ".cache/task-index.json"
+        )
+        self.upcoming_days = self._skill_config().get("upcoming_days", 7)
+        self.recurrence_horizon_days = self._skill_config().get("recurrence_horizon_days", 30)
+        self.fsync_outputs = self.config.get("workflow", {}).get("fsync_outputs", True)
+        self.timeout = self._skill_config().get("timeout", 60)
+        self.runner = CommandRunner(self.timeout, cwd=self.root)
 
     def _load_config(self) -> dict:
         """Load workflow configuration from multiple possible locations"""
-        # Try multiple config paths (project-level, global, etc.)
-        config_paths = [
-            # Project-level
-            self.root / ".skills/code-skills/config/skills-config.yaml",
-            self.root / "code-skills/config/skills-config.yaml",
-            # Claude Code global
-            Path.home() / ".claude/CodeSkills/config/skills-config.yaml",
-            # Codex CLI global
-            Path.home() / ".codex/CodeSkills/config/skills-config.yaml",
-            # Relative to script
-            Path(__file__).parent.parent / "config/skills-config.yaml",
-        ]
-        
-        for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path, encoding="utf-8") as f:
-                        return yaml.safe_load(f) or {}
-                except Exception as e:
-                    print(f"⚠️ Config load failed: {e}")
-        return {}
+        return load_config(self.root)
 
     def sync_git(self, skip_sync: bool = False) -> Dict[str, Any]:
         """Sync with remote repository"""
@@ -64,81 +63,66 @@ class TodayGenerator:
             "latest_commit": "",
             "message": "",
         }
-        
+
         if skip_sync:
             result["message"] = "Git sync skipped"
             result["success"] = True
-            try:
-                branch = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.root,
-                )
-                result["branch"] = branch.stdout.strip() or "unknown"
-            except Exception:
-                pass
+            branch = self.runner.run(["git", "branch", "--show-current"])
+            result["branch"] = branch.stdout.strip() or "unknown"
             return result
 
-        try:
-            # Check for uncommitted changes
-            status = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                cwd=self.root,
-            )
-
-            if status.stdout.strip():
-                result["message"] = "Uncommitted changes detected. Please stash or commit first."
-                result["success"] = False
-                return result
-
-            # Fetch all
-            subprocess.run(
-                ["git", "fetch", "--all"],
-                capture_output=True,
-                cwd=self.root,
-                timeout=30,
-            )
-
-            # Get current branch
-            branch = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                cwd=self.root,
-            )
-            result["branch"] = branch.stdout.strip()
-
-            # Pull latest
-            pull = subprocess.run(
-                ["git", "pull", "origin", result["branch"]],
-                capture_output=True,
-                text=True,
-                cwd=self.root,
-                timeout=60,
-            )
-
-            # Get latest commit
-            log = subprocess.run(
-                ["git", "log", "-1", "--pretty=format:%h %s"],
-                capture_output=True,
-                text=True,
-                cwd=self.root,
-            )
-            result["latest_commit"] = log.stdout.strip()
-            result["success"] = True
-            result["message"] = "Sync completed"
+        # Check for uncommitted changes and current branch together
+        status, branch = self.runner.run_many(
+            [["git", "status", "--porcelain"], ["git", "branch", "--show-current"]],
+            reserve=3,
+        )
+        if status.timed_out or branch.timed_out:
+            result["message"] = "Git operation timed out"
+            return result
+        if not status.ok:
+            result["message"] = f"Git error: {status.stderr.strip() or 'git status failed'}"
+            return result
+
+        result["branch"] = branch.stdout.strip()
+        if status.stdout.strip():
+            result["message"] = "Uncommitted changes detected. Please stash or commit first."
+            result["success"] = False
+            return result
 
-        except subprocess.TimeoutExpired:
+        # Fetch all; a slow remote stops the sync instead of spending the budget on pull
+        fetch = self.runner.run(["git", "fetch", "--all"], timeout=30, reserve=2)
+        if fetch.timed_out:
             result["message"] = "Git operation timed out"
-        except Exception as e:
-            result["message"] = f"Git error: {str(e)}"
+            return result
+
+        # Pull latest
+        pull = self.runner.run(["git", "pull", "origin", result["branch"]], timeout=60, reserve=1)
+
+        # Get latest commit
+        log = self.runner.run(["git", "log", "-1", "--pretty=format:%h %s"])
+        result["latest_commit"] = log.stdout.strip()
+
+        if pull.timed_out:
+            result["message"] = "Git operation timed out"
+        elif not pull.ok:
+            stderr = pull.stderr.strip().splitlines()
+            result["message"] = f"Git pull failed: {stderr[0] if stderr else f'exit {pull.returncode}'}"
+        else:
+            result["success"] = True
+            result["message"] = "Sync completed"
 
         return result
 
-    def scan_tasks(self) -> Dict[str, List[Dict[str, Any]]]:
+    def _skill_config(self) -> dict:
+        """Get the standup skill section (legacy `today` key as fallback)"""
+        skills = self.config.get("skills", {})
+        return skills.get("standup") or skills.get("today") or {}
+
+    def _scan_planner(self) -> ScanPlanner:
+        """Build the scan planner for configured task directories"""
+        return ScanPlanner.from_config(self.output_base_dir, self._skill_config())
+
+    def scan_tasks(self, writer: Optional[OutputWriter] = None) -> Dict[str, List[Dict[str, Any]]]:
         """Scan task files and extract metadata"""
         tasks = {
             "today": [],
@@ -148,22 +132,60 @@ class TodayGenerator:
             "long-term": [],
         }
         
-        scan_dirs_config = self.config.get("skills", {}).get("today", {}).get("scan_dirs", [])
-        
-        for relative_dir in scan_dirs_config:
-            full_scan_dir = self.output_base_dir / relative_dir
-            if not full_scan_dir.exists():
-                continue
-            
-            for md_file in full_scan_dir.rglob("*.md"):
-                if md_file.name == "README.md":
-                    continue
-                
-                task_data = self._parse_task(md_file)
-                if task_data:
-                    self._categorize_task(task_data, tasks)
+        index = TaskIndex.load(self.index_path)
+        scanned = []
+
+        for md_file in self._scan_planner().iter_files():
+            scanned.append(md_file)
+            task_data = self._parse_task(md_file)
+            if task_data:
+                self._expand_recurrence(task_data, index)
+                self._categorize_task(task_data, tasks)
+
+        index.prune(scanned)
+        try:
+            index.save(writer)
+        except OSError as e:
+            print(f"⚠️ Task index save failed: {e}")
         return tasks
 
+    def _expand_recurrence(self, task: Dict[str, Any], index: TaskIndex) -> None:
+        """Attach upcoming occurrences to recurring tasks, using the index schedule"""
+        if not (task.get("recurrence") or task.get("rrule")):
+            return
+
+        window_start = self.today.isoformat()
+        window_end = (self.today + timedelta(days=self.upcoming_days)).isoformat()
+
+        entry = index.get(task["_file"])
+        schedule = entry.get("schedule") if entry else None
+        if not schedule or schedule["from"] > window_start or schedule["to"] < window_end:
+            try:
+                rule = rule_from_task(task)
+            except RecurrenceError as e:
+                print(f"⚠️ Invalid recurrence in {task['_file'].name}: {e}")
+                return
+
+            horizon = self.today + timedelta(days=self.upcoming_days + self.recurrence_horizon_days)
+            occurrences = rule.between(self.today, horizon)
+            next_date = occurrences[0] if occurrences else rule.next_after(horizon + timedelta(days=1))
+            schedule = {
+                "from": window_start,
+                "to": horizon.isoformat(),
+                "occurrences": [d.isoformat() for d in occurrences],
+                "next": next_date.isoformat() if next_date else None,
+            }
+            index.put(task["_file"], {"schedule": schedule})
+
+        upcoming = [d for d in schedule["occurrences"] if window_start <= d <= window_end]
+        if upcoming:
+            next_iso = upcoming[0]
+        else:
+            later = [d for d in schedule["occurrences"] if d > window_end]
+            next_iso = later[0] if later else schedule["next"]
+        task["_occurrences"] = [self._parse_date(d) for d in upcoming]
+        task["_next"] = self._parse_date(next_iso)
+
     def _parse_task(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Parse task file and extract YAML frontmatter"""
         try:
@@ -202,6 +224,17 @@ class TodayGenerator:
             categories["in-progress"].append(task)
             return
 
+        # Recurring: categorize by the next occurrence in the window
+        if "_occurrences" in task:
+            occurrences = task["_occurrences"]
+            if occurrences and occurrences[0] == self.today:
+                categories["today"].append(task)
+            elif occurrences:
+                categories["upcoming"].append(task)
+            else:
+                categories["long-term"].append(task)
+            return
+
         # Parse dates
         due_date = self._parse_date(due)
         expected_date = self._parse_date(expected)
@@ -212,10 +245,10 @@ class TodayGenerator:
         # Overdue
         elif due_date and due_date < self.today:
             categories["overdue"].append(task)
-        # Upcoming (within 7 days)
-        elif due_date and due_date <= self.today + timedelta(days=7):
+        # Upcoming (within upcoming_days)
+        elif due_date and due_date <= self.today + timedelta(days=self.upcoming_days):
             categories["upcoming"].append(task)
-        elif expected_date and expected_date <= self.today + timedelta(days=7):
+        elif expected_date and expected_date <= self.today + timedelta(days=self.upcoming_days):
             categories["upcoming"].append(task)
         # Long-term
         else:
@@ -281,30 +314,40 @@ class TodayGenerator:
                     priority = task.get("priority", "P2")
                     assignee = task.get("assignee", "")
                     assignee_str = f" @{assignee}" if assignee else ""
-                    lines.append(f"- {icon} [{task_id}] {task_title} - {priority}{assignee_str}")
+                    next_date = task.get("_next")
+                    recur_str = f" ↻ {next_date.strftime('%m-%d')}" if next_date else ""
+                    lines.append(f"- {icon} [{task_id}] {task_title} - {priority}{assignee_str}{recur_str}")
                 lines.append("")
 
         # Footer
         lines.extend([
             "---",
-            f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*",
+            f"{GENERATED_PREFIX}{datetime.now().strftime('%Y-%m-%d %H:%M')}*",
         ])
 
         return "\n".join(lines)
 
-    def save_today_md(self, content: str) -> Path:
-        """Save today.md file"""
+    def save_today_md(self, content: str, writer: Optional[OutputWriter] = None) -> Path:
+        """Save today.md file (staged on `writer` if given, else written atomically)"""
         year, week, _ = self.today.isocalendar()
         week_dir = self.output_base_dir / self.worklogs_dir_name / f"{year}-W{week:02d}"
         week_dir.mkdir(parents=True, exist_ok=True)
 
         log_path = week_dir / "today.md"
-        with open(log_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        if writer is None:
+            with OutputWriter(fsync=self.fsync_outputs) as writer:
+                writer.write_text(log_path, content, ignore_prefix=GENERATED_PREFIX)
+        else:
+            writer.write_text(log_path, content, ignore_prefix=GENERATED_PREFIX)
         return log_path
 
-    def run(self, skip_sync: bool = False) -> None:
-        """Run the today workflow"""
+    def run(
+        self, skip_sync: bool = False, writer: Optional[OutputWriter] = None, show_timings: bool = False
+    ) -> None:
+        """Run the today workflow (outputs are committed by the caller if `writer` is given)"""
+        # The skill timeout is a deadline for every git call in this run
+        self.runner = CommandRunner(self.timeout, cwd=self.root)
+
         print(f"✅【CodeSkills】- Today ({self.today.strftime('%Y-%m-%d %A')})")
         print()
 
@@ -321,53 +364,81 @@ class TodayGenerator:
             print(f"  - ⚠️ {git_result.get('message', 'Failed')}")
         print()
 
-        # Scan tasks
-        tasks = self.scan_tasks()
-
-        # Display tasks
-        section_config = [
-            ("🔴 Today", "today"),
-            ("🟡 In Progress", "in-progress"),
-            ("⚠️ Overdue", "overdue"),
-            ("📅 This Week", "upcoming"),
-        ]
-
-        for title, key in section_config:
-            task_list = tasks.get(key, [])
-            if task_list:
-                print(f"{title} ({len(task_list)}):")
-                for task in task_list:
-                    task_id = task.get("id", "???")
-                    task_title = task.get("title", "Untitled")
-                    print(f"  - [{task_id}] {task_title}")
-                print()
-
-        # Generate and save
-        content = self.generate_today_md(git_result, tasks)
-        log_path = self.save_today_md(content)
+        # Staged outputs are discarded if anything below raises
+        batch = OutputWriter(fsync=self.fsync_outputs) if writer is None else nullcontext(writer)
+        with batch as writer:
+            # Scan tasks
+            tasks = self.scan_tasks(writer)
+
+            # Display tasks
+            section_config = [
+                ("🔴 Today", "today"),
+                ("🟡 In Progress", "in-progress"),
+                ("⚠️ Overdue", "overdue"),
+                ("📅 This Week", "upcoming"),
+            ]
+
+            for title, key in section_config:
+                task_list = tasks.get(key, [])
+                if task_list:
+                    print(f"{title} ({len(task_list)}):")
+                    for task in task_list:
+                        task_id = task.get("id", "???")
+                        task_title = task.get("title", "Untitled")
+                        print(f"  - [{task_id}] {task_title}")
+                    print()
+
+            # Generate and save
+            content = self.generate_today_md(git_result, tasks)
+            log_path = self.save_today_md(content, writer)
 
         print("────")
         print(f"📝 today.md generated: {log_path.relative_to(self.root)}")
         print("🔄 Next: Use /task to manage tasks, or start working")
 
+        if show_timings:
+            self._print_timings()
+
+    def _print_timings(self) -> None:
+        """Print per-command latency against the skill budget"""
+        print()
+        print(f"⏱️ Commands ({self.timeout - self.runner.remaining():.1f}s of {self.timeout}s budget):")
+        for line in self.runner.report():
+            print(f"  {line}")
+
 
 def main():
     parser = argparse.ArgumentParser(description="Generate daily task summary")
     parser.add_argument(
         "--workspace",
         type=Path,
+        action="append",
         default=None,
-        help="Workspace root path",
+        help="Workspace root path (repeat to run several workspaces)",
     )
     parser.add_argument(
         "--skip-sync",
         action="store_true",
         help="Skip git sync step",
     )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Show per-command latency",
+    )
     args = parser.parse_args()
 
-    generator = TodayGenerator(workspace_root=args.workspace)
-    generator.run(skip_sync=args.skip_sync)
+    workspaces = args.workspace or [None]
+    if len(workspaces) == 1:
+        TodayGenerator(workspace_root=workspaces[0]).run(skip_sync=args.skip_sync, show_timings=args.timings)
+        return
+
+    # Several workspaces: stage every output and fsync them in one batch
+    generators = [TodayGenerator(workspace_root=ws) for ws in workspaces]
+    with OutputWriter(fsync=any(g.fsync_outputs for g in generators)) as writer:
+        for generator in generators:
+            generator.run(skip_sync=args.skip_sync, writer=writer, show_timings=args.timings)
+            print()
 
 
 if __name__ == "__main__":
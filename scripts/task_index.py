@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Task Index - Cached Per-Task Data Between Runs
+
+Features:
+1. Persist a JSON index under the workspace output directory
+2. Key entries by task file, invalidated by file mtime
+3. Cache precomputed recurrence schedules so rules are not re-evaluated
+   on every run
+
+Usage:
+    from task_index import TaskIndex
+
+    index = TaskIndex.load(output_base_dir / ".cache/task-index.json")
+    entry = index.get(md_file)
+    ...
+    index.save()
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from output_writer import OutputWriter, write_text_atomic
+
+INDEX_VERSION = 1
+
+
+class TaskIndex:
+    """JSON-backed cache of per-task derived data"""
+
+    def __init__(self, path: Path, entries: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.path = path
+        self.entries = entries or {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> "TaskIndex":
+        """Load the index, starting empty if missing, corrupt or outdated"""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path)
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return cls(path)
+        return cls(path, data.get("entries") or {})
+
+    @staticmethod
+    def _mtime(file_path: Path) -> int:
+        """File mtime in nanoseconds, or -1 if it cannot be read"""
+        try:
+            return os.stat(file_path).st_mtime_ns
+        except OSError:
+            return -1
+
+    def get(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Cached entry for a file, or None if missing or stale"""
+        entry = self.entries.get(str(file_path))
+        if entry is None or entry.get("mtime_ns") != self._mtime(file_path):
+            return None
+        return entry
+
+    def put(self, file_path: Path, entry: Dict[str, Any]) -> None:
+        """Store an entry for a file, stamped with its current mtime"""
+        entry = dict(entry, mtime_ns=self._mtime(file_path))
+        if self.entries.get(str(file_path)) != entry:
+            self.entries[str(file_path)] = entry
+            self._dirty = True
+
+    def prune(self, keep) -> None:
+        """Drop entries for files not in `keep`"""
+        keep = {str(p) for p in keep}
+        stale = [key for key in self.entries if key not in keep]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self._dirty = True
+
+    def save(self, writer: Optional[OutputWriter] = None) -> None:
+        """Write the index if anything changed (staged on `writer` if given)"""
+        if not self._dirty:
+            return
+        payload = json.dumps(
+            {"version": INDEX_VERSION, "entries": self.entries},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        if writer is None:
+            write_text_atomic(self.path, payload)
+        else:
+            writer.write_text(self.path, payload)
+        self._dirty = False
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Trend Store - Daily Stats Time Series
+
+Features:
+1. Add one fixed-width record per @wrap run (git stats and task counts).
+   @wrap stages a copy of the file plus the record on its OutputWriter
+   batch, replacing it atomically with the worklog; standalone callers
+   append in place
+2. Memory-map the file for range queries; binary search while dates are sorted
+3. Aggregate a field per day, ISO week or month
+4. Query from the command line without re-running git log
+
+File layout:
+    header  16 bytes  magic "CSTS", version, record size, flags
+    record  32 bytes  date ordinal + 7 unsigned counters (little-endian)
+A later record for the same day supersedes earlier ones.
+
+Usage:
+    python trend_store.py insertions --days 90
+    python trend_store.py tasks_completed --since 2026-01-01 --by week
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from output_writer import OutputWriter
+from skill_config import load_config
+
+MAGIC = b"CSTS"
+VERSION = 1
+FIELDS = (
+    "commits",
+    "files",
+    "insertions",
+    "deletions",
+    "tasks_completed",
+    "tasks_in_progress",
+    "notes",
+)
+
+_HEADER = struct.Struct("<4sHHI4x")
+_RECORD = struct.Struct("<I" + "I" * len(FIELDS))
+_DATE = struct.Struct("<I")
+
+# Header flag: a record was appended out of date order, so binary search is off
+FLAG_UNSORTED = 0x1
+
+
+class TrendStore:
+    """Fixed-width daily stats records in a single append-only file"""
+
+    def __init__(self, path: Path, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+
+    # ---------- Writing ----------
+
+    def append(self, day: date, stats: Dict[str, int], writer: Optional[OutputWriter] = None) -> None:
+        """Add a record for `day`; missing fields are stored as 0
+
+        Without a `writer` the record is appended in place. With one, a copy
+        of the file plus the record is staged on its batch, so it is replaced
+        atomically with the other outputs and dropped on discard.
+        """
+        values = [max(0, int(stats.get(name, 0) or 0)) for name in FIELDS]
+        record = _RECORD.pack(day.toordinal(), *values)
+        if writer is not None:
+            self._stage(day, record, writer)
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+b") as f:
+            size, flags, last = self._scan(f)
+            new_flags = self._flags_after(flags, last, day)
+            # Drop a partial record left by an interrupted append
+            f.truncate(size)
+            if not size:
+                f.write(_HEADER.pack(MAGIC, VERSION, _RECORD.size, new_flags))
+            f.write(record)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+        if size and new_flags != flags:
+            with open(self.path, "r+b") as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, _RECORD.size, new_flags))
+
+    def _stage(self, day: date, record: bytes, writer: OutputWriter) -> None:
+        """Stage the current file plus `record` on `writer`"""
+        size, flags, last, body = 0, 0, None, b""
+        try:
+            with open(self.path, "rb") as f:
+                size, flags, last = self._scan(f)
+                if size:
+                    f.seek(_HEADER.size)
+                    body = f.read(size - _HEADER.size)
+        except FileNotFoundError:
+            pass
+        header = _HEADER.pack(MAGIC, VERSION, _RECORD.size, self._flags_after(flags, last, day))
+        writer.write_bytes(self.path, header + body + record)
+
+    def _scan(self, f) -> Tuple[int, int, Optional[int]]:
+        """Valid length, header flags and last record's date ordinal of an open file
+
+        The length excludes any partial trailing record, and is 0 when the
+        file is too short to hold a header.
+        """
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size < _HEADER.size:
+            return 0, 0, None
+
+        f.seek(0)
+        magic, version, record_size, flags = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC or version != VERSION or record_size != _RECORD.size:
+            raise ValueError(f"Unsupported stats file: {self.path}")
+        size -= (size - _HEADER.size) % _RECORD.size
+        last = None
+        if size > _HEADER.size:
+            f.seek(size - _RECORD.size)
+            last = _DATE.unpack(f.read(_DATE.size))[0]
+        return size, flags, last
+
+    @staticmethod
+    def _flags_after(flags: int, last: Optional[int], day: date) -> int:
+        """Header flags once a record for `day` follows one dated `last`"""
+        # Records out of date order turn off binary search for this file
+        if last is not None and day.toordinal() < last:
+            return flags | FLAG_UNSORTED
+        return flags
+
+    # ---------- Reading ----------
+
+    def _read(self, start: date, end: date) -> Dict[int, Tuple[int, ...]]:
+        """Latest record per day ordinal within [start, end]"""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return {}
+
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= _HEADER.size:
+                return {}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, record_size, flags = _HEADER.unpack_from(mm, 0)
+                if magic != MAGIC or version != VERSION or record_size != _RECORD.size:
+                    raise ValueError(f"Unsupported stats file: {self.path}")
+
+                count = (size - _HEADER.size) // _RECORD.size
+                lo_ord, hi_ord = start.toordinal(), end.toordinal()
+                first, last = 0, count
+                if not flags & FLAG_UNSORTED:
+                    first = self._bisect(mm, count, lo_ord)
+                    last = self._bisect(mm, count, hi_ord + 1)
+
+                rows: Dict[int, Tuple[int, ...]] = {}
+                begin = _HEADER.size + first * _RECORD.size
+                stop = _HEADER.size + last * _RECORD.size
+                with memoryview(mm)[begin:stop] as view:
+                    for row in _RECORD.iter_unpack(view):
+                        if lo_ord <= row[0] <= hi_ord:
+                            rows[row[0]] = row[1:]
+                return rows
+
+    @staticmethod
+    def _bisect(mm: mmap.mmap, count: int, ordinal: int) -> int:
+        """Index of the first record dated on or after `ordinal`"""
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _DATE.unpack_from(mm, _HEADER.size + mid * _RECORD.size)[0] < ordinal:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def range(self, start: date, end: date) -> List[Tuple[date, Dict[str, int]]]:
+        """Daily stats within [start, end], oldest first"""
+        rows = self._read(start, end)
+        return [(date.fromordinal(o), dict(zip(FIELDS, rows[o]))) for o in sorted(rows)]
+
+    def aggregate(self, field: str, start: date, end: date, by: str = "day") -> List[Tuple[str, int]]:
+        """Sum `field` per day, ISO week or month within [start, end]"""
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field: {field} (expected one of {', '.join(FIELDS)})")
+        index = FIELDS.index(field)
+
+        totals: Dict[str, int] = {}
+        rows = self._read(start, end)
+        for ordinal in sorted(rows):
+            day = date.fromordinal(ordinal)
+            if by == "week":
+                year, week, _ = day.isocalendar()
+                key = f"{year}-W{week:02d}"
+            elif by == "month":
+                key = f"{day.year}-{day.month:02d}"
+            else:
+                key = day.isoformat()
+            totals[key] = totals.get(key, 0) + rows[ordinal][index]
+        return list(totals.items())
+
+
+def load_store(root: Path, config: dict) -> TrendStore:
+    """Trend store for a workspace, located by the workflow config"""
+    workflow = config.get("workflow", {})
+    output_dir = root / workflow.get("output_dir", ".worklogs")
+    return TrendStore(
+        output_dir / workflow.get("stats_file", "stats/daily.bin"),
+        fsync=workflow.get("fsync_outputs", True),
+    )
+
+
+def _parse_day(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query daily stats recorded by @wrap")
+    parser.add_argument("field", choices=FIELDS, help="Stat to report")
+    parser.add_argument(
+        "--workspace",
+        type=Path,
+        default=None,
+        help="Workspace root path",
+    )
+    parser.add_argument("--days", type=int, default=None, help="Last N days (default 30)")
+    parser.add_argument("--since", type=_parse_day, default=None, help="Start date YYYY-MM-DD")
+    parser.add_argument("--until", type=_parse_day, default=None, help="End date YYYY-MM-DD (default today)")
+    parser.add_argument("--by", choices=("day", "week", "month"), default="day", help="Group totals")
+    args = parser.parse_args()
+
+    root = args.workspace or Path.cwd()
+    config = load_config(root)
+
+    until = args.until or date.today()
+    since = args.since or until - timedelta(days=(args.days or 30) - 1)
+    store = load_store(root, config)
+
+    rows = store.aggregate(args.field, since, until, by=args.by)
+    print(f"📊 {args.field} by {args.by} ({since.isoformat()} .. {until.isoformat()})")
+    if not rows:
+        print("  - No data")
+        return
+    width = max(len(label) for label, _ in rows)
+    for label, value in rows:
+        print(f"  {label:<{width}}  {value}")
+    print(f"  {'Total':<{width}}  {sum(v for _, v in rows)}")
+
+
+if __name__ == "__main__":
+    main()
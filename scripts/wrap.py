@@ -13,13 +13,24 @@ Usage:
 """
 
 import argparse
-import subprocess
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+from command_runner import CommandRunner
+from commit_classifier import CommitClassifier, parse_diff
+from output_writer import OutputWriter
+from scan_planner import ScanPlanner
+from skill_config import load_config
+from trend_store import load_store
+
+# Footer line left out of the unchanged-content check, so a new timestamp alone
+# does not rewrite the worklog
+GENERATED_PREFIX = "*Generated: "
+
 
 class EODGenerator:
     """Generate end of day work log"""
@@ -32,29 +43,15 @@ class EODGenerator:
         self.memos_dir_name = self.config.get("workflow", {}).get("memos_dir", "memos")
         self.tasks_dir_name = self.config.get("workflow", {}).get("tasks_dir", "tasks")
         self.worklogs_dir_name = self.config.get("workflow", {}).get("worklogs_dir", "worklogs")
+        self.fsync_outputs = self.config.get("workflow", {}).get("fsync_outputs", True)
+        self.timeout = self.config.get("skills", {}).get("wrap", {}).get("timeout", 120)
+        self.runner = CommandRunner(self.timeout, cwd=self.root)
+        # Active task metadata, read once per run
+        self._active_tasks: Optional[List[dict]] = None
 
     def _load_config(self) -> dict:
         """Load workflow configuration from multiple possible locations"""
-        config_paths = [
-            # Project-level
-            self.root / ".skills/code-skills/config/skills-config.yaml",
-            self.root / "code-skills/config/skills-config.yaml",
-            # Claude Code global
-            Path.home() / ".claude/CodeSkills/config/skills-config.yaml",
-            # Codex CLI global
-            Path.home() / ".codex/CodeSkills/config/skills-config.yaml",
-            # Relative to script
-            Path(__file__).parent.parent / "config/skills-config.yaml",
-        ]
-        
-        for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path, encoding="utf-8") as f:
-                        return yaml.safe_load(f) or {}
-                except Exception as e:
-                    print(f"⚠️ Config load failed: {e}")
-        return {}
+        return load_config(self.root)
 
     def check_git_status(self) -> Dict[str, Any]:
         """Check git status"""
@@ -64,110 +61,75 @@ class EODGenerator:
             "unpushed": [],
             "today_commits": [],
             "stats": {"files": 0, "insertions": 0, "deletions": 0},
+            # False if any git query failed or timed out
+            "ok": False,
         }
 
         try:
-            # Current branch
-            branch = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                cwd=self.root,
+            # Independent queries run concurrently
+            today_str = self.today.strftime("%Y-%m-%d")
+            branch, status, commits, numstat = self.runner.run_many(
+                [
+                    ["git", "branch", "--show-current"],
+                    ["git", "status", "--porcelain"],
+                    ["git", "log", f"--since={today_str} 00:00", "--oneline"],
+                    ["git", "log", f"--since={today_str} 00:00", "--numstat", "--format="],
+                ],
+                reserve=2,
             )
+            result["ok"] = all(r.ok for r in (branch, status, commits, numstat))
+
+            # Current branch
             result["branch"] = branch.stdout.strip()
 
             # Uncommitted changes
-            status = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                cwd=self.root,
-            )
             if status.stdout.strip():
-                result["uncommitted"] = status.stdout.strip().split("\n")
+                # Keep leading spaces: the first porcelain column marks staged changes
+                result["uncommitted"] = status.stdout.rstrip("\n").split("\n")
 
             # Unpushed commits
-            unpushed = subprocess.run(
+            unpushed = self.runner.run(
                 ["git", "log", f"origin/{result['branch']}..HEAD", "--oneline"],
-                capture_output=True,
-                text=True,
-                cwd=self.root,
+                reserve=1,
             )
             if unpushed.stdout.strip():
                 result["unpushed"] = unpushed.stdout.strip().split("\n")
 
             # Today's commits
-            today_str = self.today.strftime("%Y-%m-%d")
-            commits = subprocess.run(
-                ["git", "log", f"--since={today_str} 00:00", "--oneline"],
-                capture_output=True,
-                text=True,
-                cwd=self.root,
-            )
             if commits.stdout.strip():
                 result["today_commits"] = commits.stdout.strip().split("\n")
 
-            # Stats
-            diff_stat = subprocess.run(
-                ["git", "diff", "--stat", f"--since={today_str} 00:00", "HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=self.root,
-            )
-            # Parse stats from output
-            for line in diff_stat.stdout.split("\n"):
-                if "file" in line and "changed" in line:
-                    parts = line.split(",")
-                    for part in parts:
-                        if "file" in part:
-                            result["stats"]["files"] = int(
-                                "".join(filter(str.isdigit, part)) or 0
-                            )
-                        elif "insertion" in part:
-                            result["stats"]["insertions"] = int(
-                                "".join(filter(str.isdigit, part)) or 0
-                            )
-                        elif "deletion" in part:
-                            result["stats"]["deletions"] = int(
-                                "".join(filter(str.isdigit, part)) or 0
-                            )
+            # Sum "added<TAB>deleted<TAB>path" lines over today's commits;
+            # binary files show "-" and count as changed files only
+            files = set()
+            for line in numstat.stdout.split("\n"):
+                parts = line.split("\t", 2)
+                if len(parts) != 3:
+                    continue
+                added, deleted, path = parts
+                files.add(path)
+                result["stats"]["insertions"] += int(added) if added.isdigit() else 0
+                result["stats"]["deletions"] += int(deleted) if deleted.isdigit() else 0
+            result["stats"]["files"] = len(files)
 
         except Exception as e:
             print(f"⚠️ Git error: {e}")
 
         return result
 
-    def suggest_commit_message(self) -> Optional[str]:
-        """Suggest commit message based on changes"""
+    def suggest_commit_message(self, uncommitted: Optional[List[str]] = None) -> Optional[str]:
+        """Suggest a conventional commit message from a single diff of the changes"""
+        # Prefer staged changes; porcelain lines with a non-blank first column are staged
         try:
-            diff = subprocess.run(
-                ["git", "diff", "--cached", "--stat"],
-                capture_output=True,
-                text=True,
-                cwd=self.root,
-            )
-
-            if not diff.stdout.strip():
-                diff = subprocess.run(
-                    ["git", "diff", "--stat"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.root,
-                )
-
-            if not diff.stdout.strip():
-                return None
-
-            # Simple heuristic for commit type
-            files = diff.stdout.lower()
-            if "test" in files:
-                return "test: add/update tests"
-            elif "readme" in files or "doc" in files:
-                return "docs: update documentation"
-            elif "fix" in files:
-                return "fix: bug fixes"
+            if uncommitted is None:
+                quiet = self.runner.run(["git", "diff", "--cached", "--quiet"], reserve=1)
+                staged = quiet.returncode == 1
             else:
-                return "feat: implement changes"
+                staged = any(line[:1] not in (" ", "?", "") for line in uncommitted)
+
+            diff = self.runner.run(["git", "diff", *(["--cached"] if staged else []), "--raw", "--numstat", "-z"])
+            suggestion = CommitClassifier.from_config(self.config).classify(parse_diff(diff.stdout))
+            return suggestion.message if suggestion else None
 
         except Exception:
             return None
@@ -193,18 +155,25 @@ class EODGenerator:
 
         return memos
 
-    def scan_completed_tasks(self) -> List[dict]:
-        """Scan today's completed tasks"""
-        completed = []
-        tasks_dir = self.output_base_dir / self.tasks_dir_name / "active"
-
-        if not tasks_dir.exists():
-            return completed
+    def _scan_planner(self) -> ScanPlanner:
+        """Pruned walk over active tasks; scan_* keys from skills.standup, overridden by skills.wrap"""
+        skills = self.config.get("skills", {})
+        settings = {
+            key: value
+            for section in (skills.get("standup", {}), skills.get("wrap", {}))
+            for key, value in section.items()
+            if key.startswith("scan_")
+        }
+        settings["scan_dirs"] = [f"{self.tasks_dir_name}/active"]
+        return ScanPlanner.from_config(self.output_base_dir, settings)
 
-        for md_file in tasks_dir.rglob("*.md"):
-            if md_file.name == "README.md":
-                continue
+    def scan_active_tasks(self) -> List[dict]:
+        """Metadata of every active task, read in a single pruned walk"""
+        if self._active_tasks is not None:
+            return self._active_tasks
 
+        tasks = []
+        for md_file in self._scan_planner().iter_files():
             try:
                 content = md_file.read_text(encoding="utf-8")
                 if not content.startswith("---"):
@@ -215,54 +184,40 @@ class EODGenerator:
                     continue
 
                 metadata = yaml.safe_load(parts[1])
-                if not metadata:
-                    continue
-
-                if metadata.get("status") == "done":
-                    updated = metadata.get("updated")
-                    if updated:
-                        if hasattr(updated, "date"):
-                            updated = updated.date()
-                        elif isinstance(updated, str):
-                            updated = datetime.strptime(updated, "%Y-%m-%d").date()
-
-                        if updated == self.today:
-                            completed.append(metadata)
+                if metadata:
+                    tasks.append(metadata)
 
             except Exception:
                 pass
 
-        return completed
-
-    def scan_in_progress_tasks(self) -> List[dict]:
-        """Scan in-progress tasks"""
-        in_progress = []
-        tasks_dir = self.output_base_dir / self.tasks_dir_name / "active"
+        self._active_tasks = tasks
+        return tasks
 
-        if not tasks_dir.exists():
-            return in_progress
-
-        for md_file in tasks_dir.rglob("*.md"):
-            if md_file.name == "README.md":
+    def scan_completed_tasks(self) -> List[dict]:
+        """Scan today's completed tasks"""
+        completed = []
+        for metadata in self.scan_active_tasks():
+            if metadata.get("status") != "done":
+                continue
+            updated = metadata.get("updated")
+            if not updated:
                 continue
-
             try:
-                content = md_file.read_text(encoding="utf-8")
-                if not content.startswith("---"):
-                    continue
-
-                parts = content.split("---", 2)
-                if len(parts) < 3:
-                    continue
+                if hasattr(updated, "date"):
+                    updated = updated.date()
+                elif isinstance(updated, str):
+                    updated = datetime.strptime(updated, "%Y-%m-%d").date()
+            except ValueError:
+                continue
 
-                metadata = yaml.safe_load(parts[1])
-                if metadata and metadata.get("status") == "in-progress":
-                    in_progress.append(metadata)
+            if updated == self.today:
+                completed.append(metadata)
 
-            except Exception:
-                pass
+        return completed
 
-        return in_progress
+    def scan_in_progress_tasks(self) -> List[dict]:
+        """Scan in-progress tasks"""
+        return [m for m in self.scan_active_tasks() if m.get("status") == "in-progress"]
 
     def generate_worklog(
         self,
@@ -331,13 +286,13 @@ class EODGenerator:
         # Footer
         lines.extend([
             "---",
-            f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*",
+            f"{GENERATED_PREFIX}{datetime.now().strftime('%Y-%m-%d %H:%M')}*",
         ])
 
         return "\n".join(lines)
 
-    def save_worklog(self, content: str) -> Path:
-        """Save work log"""
+    def save_worklog(self, content: str, writer: Optional[OutputWriter] = None) -> Path:
+        """Save work log (staged on `writer` if given, else written atomically)"""
         year, week, _ = self.today.isocalendar()
         week_dir = self.output_base_dir / self.worklogs_dir_name / f"{year}-W{week:02d}"
         week_dir.mkdir(parents=True, exist_ok=True)
@@ -345,13 +300,46 @@ class EODGenerator:
         day_str = f"{self.today.month:02d}-{self.today.day:02d}"
         log_path = week_dir / f"{day_str}.md"
 
-        with open(log_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        if writer is None:
+            with OutputWriter(fsync=self.fsync_outputs) as writer:
+                writer.write_text(log_path, content, ignore_prefix=GENERATED_PREFIX)
+        else:
+            writer.write_text(log_path, content, ignore_prefix=GENERATED_PREFIX)
 
         return log_path
 
-    def run(self) -> None:
-        """Run the EOD workflow"""
+    def record_stats(
+        self,
+        git_status: Dict[str, Any],
+        completed_tasks: List[dict],
+        in_progress_tasks: List[dict],
+        memos: List[str],
+        writer: Optional[OutputWriter] = None,
+    ) -> None:
+        """Append today's numbers to the stats trend store (staged on `writer` if given)"""
+        if not self.config.get("skills", {}).get("wrap", {}).get("record_stats", True):
+            return
+        if not git_status.get("ok"):
+            # A later record replaces the day's, so never record partial git numbers
+            print("⚠️ Stats not recorded: git queries failed or timed out")
+            return
+        stats = dict(
+            git_status["stats"],
+            commits=len(git_status.get("today_commits", [])),
+            tasks_completed=len(completed_tasks),
+            tasks_in_progress=len(in_progress_tasks),
+            notes=len(memos),
+        )
+        try:
+            load_store(self.root, self.config).append(self.today, stats, writer)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Stats record failed: {e}")
+
+    def run(self, writer: Optional[OutputWriter] = None, show_timings: bool = False) -> None:
+        """Run the EOD workflow (outputs are committed by the caller if `writer` is given)"""
+        # The skill timeout is a deadline for every git call in this run
+        self.runner = CommandRunner(self.timeout, cwd=self.root)
+        self._active_tasks = None
         print(f"✅【CodeSkills】- End of Day ({self.today.strftime('%Y-%m-%d')})")
         print()
 
@@ -380,7 +368,7 @@ class EODGenerator:
 
         # Suggest commit if needed
         if git_status["uncommitted"]:
-            suggestion = self.suggest_commit_message()
+            suggestion = self.suggest_commit_message(git_status["uncommitted"])
             if suggestion:
                 print(f"💡 Suggested commit: {suggestion}")
                 print()
@@ -402,9 +390,12 @@ class EODGenerator:
                 print(f"  - [{task.get('id')}] {task.get('title')}")
             print()
 
-        # Generate and save
+        # Generate and save; the worklog and stats record are committed together
         content = self.generate_worklog(git_status, completed, in_progress, memos)
-        log_path = self.save_worklog(content)
+        batch = OutputWriter(fsync=self.fsync_outputs) if writer is None else nullcontext(writer)
+        with batch as writer:
+            log_path = self.save_worklog(content, writer)
+            self.record_stats(git_status, completed, in_progress, memos, writer)
 
         print("────")
         print(f"📝 Work log generated: {log_path.relative_to(self.root)}")
@@ -412,19 +403,44 @@ class EODGenerator:
         if git_status["unpushed"]:
             print("🔄 Next: Consider running `git push`")
 
+        if show_timings:
+            self._print_timings()
+
+    def _print_timings(self) -> None:
+        """Print per-command latency against the skill budget"""
+        print()
+        print(f"⏱️ Commands ({self.timeout - self.runner.remaining():.1f}s of {self.timeout}s budget):")
+        for line in self.runner.report():
+            print(f"  {line}")
+
 
 def main():
     parser = argparse.ArgumentParser(description="Generate end of day work log")
     parser.add_argument(
         "--workspace",
         type=Path,
+        action="append",
         default=None,
-        help="Workspace root path",
+        help="Workspace root path (repeat to run several workspaces)",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Show per-command latency",
     )
     args = parser.parse_args()
 
-    generator = EODGenerator(workspace_root=args.workspace)
-    generator.run()
+    workspaces = args.workspace or [None]
+    if len(workspaces) == 1:
+        EODGenerator(workspace_root=workspaces[0]).run(show_timings=args.timings)
+        return
+
+    # Several workspaces: stage every output and fsync them in one batch
+    generators = [EODGenerator(workspace_root=ws) for ws in workspaces]
+    with OutputWriter(fsync=any(g.fsync_outputs for g in generators)) as writer:
+        for generator in generators:
+            generator.run(writer=writer, show_timings=args.timings)
+            print()
 
 
 if __name__ == "__main__":